@@ -4,9 +4,14 @@ SQLite Database Module for Transcriptor Pipeline
 Handles all database operations for transcription history and job management.
 """
 
+import atexit
+import os
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
 import json
@@ -14,6 +19,48 @@ import json
 # Database path
 DB_PATH = Path(__file__).parent.parent / "data" / "transcriptor.db"
 
+# Bumped whenever init_database() gains a migration; stored in PRAGMA user_version
+SCHEMA_VERSION = 2
+
+# Per-connection tuning (busy_timeout first so it covers the statements after it)
+_PRAGMAS = (
+    'PRAGMA busy_timeout=5000',
+    'PRAGMA journal_mode=WAL',
+    'PRAGMA synchronous=NORMAL',
+    'PRAGMA temp_store=MEMORY',
+    'PRAGMA cache_size=-20000',
+    'PRAGMA foreign_keys=ON',
+)
+# Read-only connections cannot switch the journal mode (the writer owns it)
+_READ_PRAGMAS = tuple(p for p in _PRAGMAS if 'journal_mode' not in p)
+
+# Schema is created lazily on first use (or by an explicit init_database() call)
+_initialized = False
+_init_lock = threading.Lock()
+
+# Process-wide connections: one serialized writer + a bounded reader pool
+_write_conn: Optional[sqlite3.Connection] = None
+_write_lock = threading.Lock()
+_read_pool: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=os.cpu_count() or 4)
+
+# Planner statistics refresh cadence for long-running processes (seconds)
+_OPTIMIZE_INTERVAL = 3600
+_last_optimize = 0.0
+
+# get_statistics() memo; dropped after every write that changes job rows
+_STATS_TTL = 5.0
+_stats_cache: Dict[str, Any] = {'t': 0.0, 'v': None}
+
+# get_job_log_file() memo: job_id -> log file path, for jobs whose path is set
+_LOG_FILE_CACHE_SIZE = 1024
+_log_file_cache: Dict[int, str] = {}
+
+# Heartbeats are buffered and written in one transaction per flush interval
+_HEARTBEAT_FLUSH_INTERVAL = 2.0
+_heartbeat_queue: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+_heartbeat_thread: Optional[threading.Thread] = None
+_heartbeat_lock = threading.Lock()
+
 
 def get_db_path() -> Path:
     """Get database path, ensuring directory exists."""
@@ -21,99 +68,248 @@ def get_db_path() -> Path:
     return DB_PATH
 
 
-@contextmanager
-def get_connection():
-    """Context manager for database connections."""
-    conn = sqlite3.connect(get_db_path())
+def _apply_pragmas(conn: sqlite3.Connection, pragmas: tuple = _PRAGMAS):
+    """Apply connection tuning PRAGMAs (idempotent, safe on existing DBs)."""
+    conn.executescript(';\n'.join(pragmas) + ';')
+
+
+def _get_writer() -> sqlite3.Connection:
+    """Get (creating on first use) the single writer connection."""
+    global _write_conn
+    if _write_conn is None:
+        # Autocommit mode: transactions are opened explicitly with BEGIN IMMEDIATE
+        conn = sqlite3.connect(
+            get_db_path(), timeout=5.0, check_same_thread=False, isolation_level=None
+        )
+        conn.row_factory = sqlite3.Row
+        _apply_pragmas(conn)
+        _write_conn = conn
+    return _write_conn
+
+
+def _new_reader() -> sqlite3.Connection:
+    """Open a read-only connection (the writer creates the file first)."""
+    with _write_lock:
+        _get_writer()
+    conn = sqlite3.connect(
+        f"file:{get_db_path()}?mode=ro", uri=True, timeout=5.0, check_same_thread=False
+    )
     conn.row_factory = sqlite3.Row
+    _apply_pragmas(conn, _READ_PRAGMAS)
+    return conn
+
+
+def _ensure_schema():
+    """Run init_database() once per process before the first query."""
+    if not _initialized:
+        with _init_lock:
+            if not _initialized:
+                init_database()
+
+
+@contextmanager
+def get_write_conn():
+    """Context manager for the serialized writer (one BEGIN IMMEDIATE transaction)."""
+    _ensure_schema()
+    with _write_transaction() as conn:
+        yield conn
+
+
+@contextmanager
+def _write_transaction():
+    """Writer transaction without the schema check (used by init_database)."""
+    with _write_lock:
+        conn = _get_writer()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        if time.monotonic() - _last_optimize > _OPTIMIZE_INTERVAL:
+            _optimize(conn)
+
+
+@contextmanager
+def get_read_conn():
+    """Context manager for a pooled read-only connection."""
+    _ensure_schema()
+    try:
+        conn = _read_pool.get_nowait()
+    except queue.Empty:
+        conn = _new_reader()
     try:
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
     finally:
-        conn.close()
+        try:
+            _read_pool.put_nowait(conn)
+        except queue.Full:
+            conn.close()
 
 
-def init_database():
-    """Initialize database with required tables."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+# Backwards-compatible name: callers that may write get the writer
+get_connection = get_write_conn
 
-        # Transcription jobs table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS transcription_jobs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                filename TEXT NOT NULL,
-                original_path TEXT,
-                output_path TEXT,
-                duration_minutes REAL DEFAULT 0,
-                model TEXT DEFAULT 'medium',
-                processes INTEGER DEFAULT 2,
-                workers INTEGER DEFAULT 8,
-                status TEXT DEFAULT 'pending',
-                progress REAL DEFAULT 0,
-                elapsed_seconds REAL DEFAULT 0,
-                speed REAL DEFAULT 0,
-                transcript TEXT,
-                error_message TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                started_at TIMESTAMP,
-                completed_at TIMESTAMP,
-                pid INTEGER,
-                heartbeat TIMESTAMP,
-                log_file TEXT
-            )
-        ''')
 
-        # Migration: Add new columns if they don't exist (for existing databases)
-        try:
-            cursor.execute('ALTER TABLE transcription_jobs ADD COLUMN pid INTEGER')
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        try:
-            cursor.execute('ALTER TABLE transcription_jobs ADD COLUMN heartbeat TIMESTAMP')
-        except sqlite3.OperationalError:
-            pass
-        try:
-            cursor.execute('ALTER TABLE transcription_jobs ADD COLUMN log_file TEXT')
-        except sqlite3.OperationalError:
-            pass
+def _optimize(conn: sqlite3.Connection, mask: Optional[int] = None):
+    """Run PRAGMA optimize on a connection outside of any transaction."""
+    global _last_optimize
+    # SQLite >= 3.46 bounds the analysis itself; older versions need a limit
+    if sqlite3.sqlite_version_info < (3, 46, 0):
+        conn.execute('PRAGMA analysis_limit=400')
+    conn.execute('PRAGMA optimize' if mask is None else f'PRAGMA optimize={mask:#x}')
+    _last_optimize = time.monotonic()
 
-        # Settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                key TEXT PRIMARY KEY,
-                value TEXT,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
 
-        # Statistics table (for caching)
+def pragma_optimize(force: bool = False):
+    """
+    Refresh query planner statistics.
+
+    Args:
+        force: Analyze every table (0x10002) instead of only those SQLite
+            thinks have changed, e.g. right after creating indexes.
+    """
+    with _write_lock:
+        _optimize(_get_writer(), 0x10002 if force else None)
+
+
+@atexit.register
+def close_connections():
+    """Flush heartbeats, optimize and close all pooled connections (atexit)."""
+    global _write_conn
+    try:
+        _flush_heartbeats()
+    except sqlite3.Error:
+        pass
+    while True:
+        try:
+            _read_pool.get_nowait().close()
+        except queue.Empty:
+            break
+    with _write_lock:
+        if _write_conn is not None:
+            try:
+                _optimize(_write_conn)
+            except sqlite3.Error:
+                pass
+            _write_conn.close()
+            _write_conn = None
+
+
+def _migrate_schema(cursor: sqlite3.Cursor, version: int):
+    """Create tables/indexes and apply migrations newer than `version`."""
+    # Transcription jobs table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS transcription_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            filename TEXT NOT NULL,
+            original_path TEXT,
+            output_path TEXT,
+            duration_minutes REAL DEFAULT 0,
+            model TEXT DEFAULT 'medium',
+            processes INTEGER DEFAULT 2,
+            workers INTEGER DEFAULT 8,
+            status TEXT DEFAULT 'pending',
+            progress REAL DEFAULT 0,
+            elapsed_seconds REAL DEFAULT 0,
+            speed REAL DEFAULT 0,
+            transcript TEXT,
+            error_message TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            started_at TIMESTAMP,
+            completed_at TIMESTAMP,
+            pid INTEGER,
+            heartbeat TIMESTAMP,
+            log_file TEXT
+        )
+    ''')
+
+    # Migration 1: process tracking columns (for databases created before them)
+    if version < 1:
+        existing = {row[1] for row in cursor.execute('PRAGMA table_info(transcription_jobs)')}
+        for column, col_type in (('pid', 'INTEGER'), ('heartbeat', 'TIMESTAMP'), ('log_file', 'TEXT')):
+            if column not in existing:
+                cursor.execute(f'ALTER TABLE transcription_jobs ADD COLUMN {column} {col_type}')
+
+    # Settings table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS settings (
+            key TEXT PRIMARY KEY,
+            value TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Statistics table (for caching)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS statistics (
+            id INTEGER PRIMARY KEY,
+            total_jobs INTEGER DEFAULT 0,
+            successful_jobs INTEGER DEFAULT 0,
+            failed_jobs INTEGER DEFAULT 0,
+            total_audio_minutes REAL DEFAULT 0,
+            total_processing_minutes REAL DEFAULT 0,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Create indexes
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON transcription_jobs(status)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_created ON transcription_jobs(created_at DESC)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_pid ON transcription_jobs(pid)')
+
+    # Migration 2: partial index for the orphan scan (status + heartbeat),
+    # which subsumes the old single-column heartbeat index
+    if version < 2:
         cursor.execute('''
-            CREATE TABLE IF NOT EXISTS statistics (
-                id INTEGER PRIMARY KEY,
-                total_jobs INTEGER DEFAULT 0,
-                successful_jobs INTEGER DEFAULT 0,
-                failed_jobs INTEGER DEFAULT 0,
-                total_audio_minutes REAL DEFAULT 0,
-                total_processing_minutes REAL DEFAULT 0,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+            CREATE INDEX IF NOT EXISTS idx_jobs_proc_heartbeat
+            ON transcription_jobs(status, heartbeat)
+            WHERE status = 'processing'
         ''')
+        cursor.execute('DROP INDEX IF EXISTS idx_jobs_heartbeat')
+
+    cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+
 
-        # Create indexes
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_status ON transcription_jobs(status)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_created ON transcription_jobs(created_at DESC)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_pid ON transcription_jobs(pid)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_heartbeat ON transcription_jobs(heartbeat)')
+def init_database():
+    """Initialize database with required tables."""
+    global _initialized
+    # The writer applies _PRAGMAS on open; WAL mode persists in the DB file
+    with _write_transaction() as conn:
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        # Warm start: schema is current, skip all DDL (no schema cookie churn)
+        if version < SCHEMA_VERSION:
+            _migrate_schema(conn.cursor(), version)
+
+    if version < SCHEMA_VERSION:
+        # Analyze once so the planner knows about the new indexes
+        pragma_optimize(force=True)
 
-        conn.commit()
+    _start_heartbeat_flusher()
+    _initialized = True
 
 
 # ==================== Job Operations ====================
 
+def _tuple_cursor(conn: sqlite3.Connection) -> sqlite3.Cursor:
+    """Cursor returning plain tuples (no per-row sqlite3.Row object)."""
+    cursor = conn.cursor()
+    cursor.row_factory = None
+    return cursor
+
+
+def _as_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """Fetch all rows of a tuple cursor as dicts, resolving column names once."""
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def _invalidate_stats():
+    """Drop the cached get_statistics() result (call after the commit)."""
+    _stats_cache['v'] = None
+
+
 def create_job(
     filename: str,
     original_path: str,
@@ -123,14 +319,15 @@ def create_job(
     workers: int = 8
 ) -> int:
     """Create a new transcription job."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+    with get_write_conn() as conn:
+        cursor = conn.execute('''
             INSERT INTO transcription_jobs
             (filename, original_path, duration_minutes, model, processes, workers, status)
             VALUES (?, ?, ?, ?, ?, ?, 'pending')
         ''', (filename, original_path, duration_minutes, model, processes, workers))
-        return cursor.lastrowid
+        job_id = cursor.lastrowid
+    _invalidate_stats()
+    return job_id
 
 
 def update_job_status(
@@ -142,9 +339,7 @@ def update_job_status(
     log_file: str = None
 ):
     """Update job status."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-
+    with get_write_conn() as conn:
         updates = ['status = ?']
         params = [status]
 
@@ -173,11 +368,14 @@ def update_job_status(
 
         params.append(job_id)
 
-        cursor.execute(f'''
+        conn.execute(f'''
             UPDATE transcription_jobs
             SET {', '.join(updates)}
             WHERE id = ?
         ''', params)
+    if log_file is not None:
+        _log_file_cache.pop(job_id, None)
+    _invalidate_stats()
 
 
 def complete_job(
@@ -188,9 +386,8 @@ def complete_job(
     speed: float
 ):
     """Mark job as completed with results."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+    with get_write_conn() as conn:
+        conn.execute('''
             UPDATE transcription_jobs
             SET status = 'completed',
                 output_path = ?,
@@ -201,28 +398,29 @@ def complete_job(
                 completed_at = CURRENT_TIMESTAMP
             WHERE id = ?
         ''', (output_path, transcript, elapsed_seconds, speed, job_id))
+    _invalidate_stats()
 
 
 def fail_job(job_id: int, error_message: str):
     """Mark job as failed with error message."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+    with get_write_conn() as conn:
+        conn.execute('''
             UPDATE transcription_jobs
             SET status = 'failed',
                 error_message = ?,
                 completed_at = CURRENT_TIMESTAMP
             WHERE id = ?
         ''', (error_message, job_id))
+    _invalidate_stats()
 
 
 def get_job(job_id: int) -> Optional[Dict]:
     """Get job by ID."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    with get_read_conn() as conn:
+        cursor = _tuple_cursor(conn)
         cursor.execute('SELECT * FROM transcription_jobs WHERE id = ?', (job_id,))
-        row = cursor.fetchone()
-        return dict(row) if row else None
+        rows = _as_dicts(cursor)
+        return rows[0] if rows else None
 
 
 def get_jobs(
@@ -231,8 +429,8 @@ def get_jobs(
     offset: int = 0
 ) -> List[Dict]:
     """Get jobs with optional filtering."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    with get_read_conn() as conn:
+        cursor = _tuple_cursor(conn)
 
         query = 'SELECT * FROM transcription_jobs'
         params = []
@@ -245,7 +443,7 @@ def get_jobs(
         params.extend([limit, offset])
 
         cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return _as_dicts(cursor)
 
 
 def get_recent_jobs(limit: int = 10) -> List[Dict]:
@@ -255,47 +453,89 @@ def get_recent_jobs(limit: int = 10) -> List[Dict]:
 
 def delete_job(job_id: int):
     """Delete a job."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM transcription_jobs WHERE id = ?', (job_id,))
+    with get_write_conn() as conn:
+        conn.execute('DELETE FROM transcription_jobs WHERE id = ?', (job_id,))
+    _log_file_cache.pop(job_id, None)
+    _invalidate_stats()
 
 
 def clear_all_jobs():
     """Delete all jobs."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM transcription_jobs')
+    with get_write_conn() as conn:
+        conn.execute('DELETE FROM transcription_jobs')
+    _log_file_cache.clear()
+    _invalidate_stats()
 
 
 # ==================== Process Management ====================
 
 def update_heartbeat(job_id: int):
-    """Update job heartbeat timestamp."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
-            UPDATE transcription_jobs
-            SET heartbeat = CURRENT_TIMESTAMP
-            WHERE id = ?
-        ''', (job_id,))
+    """Queue a heartbeat update; written by the background flusher."""
+    if _heartbeat_thread is None:
+        _start_heartbeat_flusher()
+    # Same text format as CURRENT_TIMESTAMP (UTC)
+    now = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    _heartbeat_queue.put((job_id, now))
+
+
+def _flush_heartbeats() -> int:
+    """Write all queued heartbeats (latest per job) in one transaction."""
+    latest: Dict[int, str] = {}
+    while True:
+        try:
+            job_id, ts = _heartbeat_queue.get_nowait()
+        except queue.Empty:
+            break
+        latest[job_id] = ts
+
+    if latest:
+        with get_write_conn() as conn:
+            conn.executemany(
+                'UPDATE transcription_jobs SET heartbeat = ? WHERE id = ?',
+                [(ts, job_id) for job_id, ts in latest.items()]
+            )
+    return len(latest)
+
+
+def _heartbeat_flush_loop():
+    """Background loop flushing queued heartbeats."""
+    while True:
+        time.sleep(_HEARTBEAT_FLUSH_INTERVAL)
+        try:
+            _flush_heartbeats()
+        except sqlite3.Error as e:
+            print(f"Failed to flush heartbeats: {e}")
+
+
+def _start_heartbeat_flusher():
+    """Start the heartbeat flusher thread once per process."""
+    global _heartbeat_thread
+    with _heartbeat_lock:
+        if _heartbeat_thread is None:
+            _heartbeat_thread = threading.Thread(
+                target=_heartbeat_flush_loop,
+                name='db-heartbeat-flusher',
+                daemon=True
+            )
+            _heartbeat_thread.start()
 
 
 def get_active_jobs() -> List[Dict]:
     """Get all active (processing) jobs with PID."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    with get_read_conn() as conn:
+        cursor = _tuple_cursor(conn)
         cursor.execute('''
             SELECT * FROM transcription_jobs
             WHERE status = 'processing' AND pid IS NOT NULL
             ORDER BY started_at DESC
         ''')
-        return [dict(row) for row in cursor.fetchall()]
+        return _as_dicts(cursor)
 
 
 def get_orphaned_jobs(timeout_seconds: int = 60) -> List[Dict]:
     """Get jobs that appear to be orphaned (no heartbeat update)."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    with get_read_conn() as conn:
+        cursor = _tuple_cursor(conn)
         cursor.execute('''
             SELECT * FROM transcription_jobs
             WHERE status = 'processing'
@@ -304,14 +544,13 @@ def get_orphaned_jobs(timeout_seconds: int = 60) -> List[Dict]:
                 OR datetime(heartbeat) < datetime('now', ? || ' seconds')
             )
         ''', (f'-{timeout_seconds}',))
-        return [dict(row) for row in cursor.fetchall()]
+        return _as_dicts(cursor)
 
 
 def cancel_job(job_id: int, reason: str = 'Cancelled by user'):
     """Mark job as cancelled."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('''
+    with get_write_conn() as conn:
+        conn.execute('''
             UPDATE transcription_jobs
             SET status = 'cancelled',
                 error_message = ?,
@@ -319,70 +558,73 @@ def cancel_job(job_id: int, reason: str = 'Cancelled by user'):
                 pid = NULL
             WHERE id = ?
         ''', (reason, job_id))
+    _invalidate_stats()
 
 
 def get_job_log_file(job_id: int) -> Optional[str]:
-    """Get log file path for a job."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT log_file FROM transcription_jobs WHERE id = ?', (job_id,))
-        row = cursor.fetchone()
-        return row['log_file'] if row else None
-
-
-def cleanup_stale_jobs():
-    """Mark stale processing jobs as failed."""
-    orphaned = get_orphaned_jobs(timeout_seconds=120)  # 2 minutes timeout
-    for job in orphaned:
-        with get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE transcription_jobs
-                SET status = 'failed',
-                    error_message = 'Process terminated unexpectedly (no heartbeat)',
-                    completed_at = CURRENT_TIMESTAMP,
-                    pid = NULL
-                WHERE id = ?
-            ''', (job['id'],))
-    return len(orphaned)
+    """Get log file path for a job (memoized once set; dropped when it changes)."""
+    log_file = _log_file_cache.get(job_id)
+    if log_file is not None:
+        return log_file
+
+    with get_read_conn() as conn:
+        row = conn.execute(
+            'SELECT log_file FROM transcription_jobs WHERE id = ?', (job_id,)
+        ).fetchone()
+    log_file = row['log_file'] if row else None
+
+    # A missing path is not memoized: another process may set it later
+    if log_file is not None:
+        if len(_log_file_cache) >= _LOG_FILE_CACHE_SIZE:
+            _log_file_cache.clear()
+        _log_file_cache[job_id] = log_file
+    return log_file
+
+
+def cleanup_stale_jobs(timeout_seconds: int = 120) -> int:
+    """Mark stale processing jobs as failed (single UPDATE)."""
+    with get_write_conn() as conn:
+        cleaned = conn.execute('''
+            UPDATE transcription_jobs
+            SET status = 'failed',
+                error_message = 'Process terminated unexpectedly (no heartbeat)',
+                completed_at = CURRENT_TIMESTAMP,
+                pid = NULL
+            WHERE status = 'processing'
+            AND (
+                heartbeat IS NULL
+                OR datetime(heartbeat) < datetime('now', ? || ' seconds')
+            )
+        ''', (f'-{timeout_seconds}',)).rowcount
+    if cleaned:
+        _invalidate_stats()
+    return cleaned
 
 
 # ==================== Statistics ====================
 
 def get_statistics() -> Dict:
-    """Get transcription statistics."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-
-        # Total jobs
-        cursor.execute('SELECT COUNT(*) FROM transcription_jobs')
-        total = cursor.fetchone()[0]
-
-        # Successful jobs
-        cursor.execute("SELECT COUNT(*) FROM transcription_jobs WHERE status = 'completed'")
-        successful = cursor.fetchone()[0]
-
-        # Failed jobs
-        cursor.execute("SELECT COUNT(*) FROM transcription_jobs WHERE status = 'failed'")
-        failed = cursor.fetchone()[0]
-
-        # Total audio minutes
-        cursor.execute('SELECT COALESCE(SUM(duration_minutes), 0) FROM transcription_jobs')
-        total_audio = cursor.fetchone()[0]
-
-        # Total processing time
-        cursor.execute('SELECT COALESCE(SUM(elapsed_seconds), 0) FROM transcription_jobs')
-        total_processing = cursor.fetchone()[0] / 60  # Convert to minutes
-
-        # Average speed (only successful jobs with speed > 0)
-        cursor.execute('''
-            SELECT COALESCE(AVG(speed), 0)
+    """Get transcription statistics (cached for a few seconds)."""
+    cached = _stats_cache['v']
+    if cached is not None and time.monotonic() - _stats_cache['t'] < _STATS_TTL:
+        return dict(cached)
+
+    with get_read_conn() as conn:
+        # One scan, one consistent snapshot for all counters
+        row = conn.execute('''
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(status = 'completed'), 0),
+                COALESCE(SUM(status = 'failed'), 0),
+                COALESCE(SUM(duration_minutes), 0),
+                COALESCE(SUM(elapsed_seconds), 0),
+                COALESCE(AVG(CASE WHEN status = 'completed' AND speed > 0 THEN speed END), 0)
             FROM transcription_jobs
-            WHERE status = 'completed' AND speed > 0
-        ''')
-        avg_speed = cursor.fetchone()[0]
+        ''').fetchone()
+        total, successful, failed, total_audio, total_elapsed, avg_speed = row
+        total_processing = total_elapsed / 60  # Convert to minutes
 
-        return {
+        stats = {
             'total_jobs': total,
             'successful_jobs': successful,
             'failed_jobs': failed,
@@ -393,15 +635,17 @@ def get_statistics() -> Dict:
             'average_speed': avg_speed
         }
 
+    _stats_cache['t'] = time.monotonic()
+    _stats_cache['v'] = stats
+    return dict(stats)
+
 
 # ==================== Settings ====================
 
 def get_setting(key: str, default: Any = None) -> Any:
     """Get a setting value."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT value FROM settings WHERE key = ?', (key,))
-        row = cursor.fetchone()
+    with get_read_conn() as conn:
+        row = conn.execute('SELECT value FROM settings WHERE key = ?', (key,)).fetchone()
         if row:
             try:
                 return json.loads(row[0])
@@ -412,10 +656,9 @@ def get_setting(key: str, default: Any = None) -> Any:
 
 def set_setting(key: str, value: Any):
     """Set a setting value."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        value_str = json.dumps(value) if not isinstance(value, str) else value
-        cursor.execute('''
+    value_str = json.dumps(value) if not isinstance(value, str) else value
+    with get_write_conn() as conn:
+        conn.execute('''
             INSERT OR REPLACE INTO settings (key, value, updated_at)
             VALUES (?, ?, CURRENT_TIMESTAMP)
         ''', (key, value_str))
@@ -423,11 +666,9 @@ def set_setting(key: str, value: Any):
 
 def get_all_settings() -> Dict:
     """Get all settings."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute('SELECT key, value FROM settings')
+    with get_read_conn() as conn:
         settings = {}
-        for row in cursor.fetchall():
+        for row in conn.execute('SELECT key, value FROM settings'):
             try:
                 settings[row[0]] = json.loads(row[1])
             except:
@@ -448,39 +689,40 @@ def migrate_from_json(json_path: Path):
     except:
         return 0
 
-    migrated = 0
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    rows = []
+    for entry in history:
+        try:
+            # Parse timestamp
+            timestamp = entry.get('timestamp', '')
+            created_at = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
+        except (AttributeError, TypeError, ValueError) as e:
+            print(f"Failed to migrate entry: {e}")
+            continue
+
+        rows.append((
+            entry.get('filename', 'Unknown'),
+            entry.get('output_path', ''),
+            entry.get('duration_minutes', 0),
+            entry.get('model', 'medium'),
+            entry.get('elapsed_seconds', 0),
+            entry.get('speed', 0),
+            'completed' if entry.get('success', False) else 'failed',
+            created_at,
+            created_at
+        ))
+
+    if not rows:
+        return 0
+
+    # One transaction, one executemany for the whole history
+    with get_write_conn() as conn:
+        conn.executemany('''
+            INSERT INTO transcription_jobs
+            (filename, output_path, duration_minutes, model,
+             elapsed_seconds, speed, status, created_at, completed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', rows)
+
+    _invalidate_stats()
+    return len(rows)
 
-        for entry in history:
-            try:
-                # Parse timestamp
-                timestamp = entry.get('timestamp', '')
-                created_at = datetime.fromisoformat(timestamp) if timestamp else datetime.now()
-
-                cursor.execute('''
-                    INSERT INTO transcription_jobs
-                    (filename, output_path, duration_minutes, model,
-                     elapsed_seconds, speed, status, created_at, completed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    entry.get('filename', 'Unknown'),
-                    entry.get('output_path', ''),
-                    entry.get('duration_minutes', 0),
-                    entry.get('model', 'medium'),
-                    entry.get('elapsed_seconds', 0),
-                    entry.get('speed', 0),
-                    'completed' if entry.get('success', False) else 'failed',
-                    created_at,
-                    created_at
-                ))
-                migrated += 1
-            except Exception as e:
-                print(f"Failed to migrate entry: {e}")
-                continue
-
-    return migrated
-
-
-# Initialize database on import
-init_database()
@@ -3,7 +3,7 @@ Audio Preprocessing Service
 
 Enhances audio quality before transcription using FFmpeg filters:
 - Noise reduction
-- Loudness normalization
+- Loudness normalization (single-pass dynaudnorm, or EBU R128 loudnorm)
 - Speech frequency enhancement (200-3000 Hz)
 - Format conversion to 16kHz mono WAV
 
@@ -12,14 +12,30 @@ This preprocessing step can improve transcription accuracy by 10-15%.
 
 import subprocess
 import os
+import re
 import json
+import wave
 import logging
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# "Duration: 01:02:03.45" line that FFmpeg prints for its input
+_DURATION_RE = re.compile(r"Duration:\s*(\d+):(\d+):(\d+(?:\.\d+)?)")
+
+# Frames quieter than this (about -80 dBFS) count as digital silence in
+# estimate_snr(), not as the noise floor
+_SILENT_FRAME_RMS = 1e-4
+
 
 class AudioPreprocessor:
     """
@@ -27,7 +43,8 @@ class AudioPreprocessor:
 
     Features:
     - Noise reduction (highpass/lowpass filters)
-    - Loudness normalization (-16 LUFS target)
+    - Loudness normalization: dynaudnorm (default, single pass, constant
+      memory) or loudnorm (-16 LUFS target, slower but peak-accurate)
     - Speech frequency enhancement (200-3000 Hz bandpass)
     - Conversion to 16kHz mono WAV (optimal for Whisper)
 
@@ -49,20 +66,37 @@ class AudioPreprocessor:
         highpass_freq: int = 200,
         lowpass_freq: int = 3000,
         sample_rate: int = 16000,
+        mode: str = "dynaudnorm",
     ):
         """
         Initialize audio preprocessor.
 
         Args:
-            target_lufs: Target loudness in LUFS (-16 is speech standard)
+            target_lufs: Target loudness in LUFS (-16 is speech standard),
+                used by the "loudnorm" mode only
             highpass_freq: High-pass filter frequency (Hz) - removes low rumble
             lowpass_freq: Low-pass filter frequency (Hz) - removes high noise
             sample_rate: Output sample rate (16000 Hz is Whisper standard)
+            mode: Normalization filter - "dynaudnorm" (fast) or "loudnorm"
         """
+        if mode not in ("dynaudnorm", "loudnorm"):
+            raise ValueError(f"Unknown normalization mode: {mode}")
+
         self.target_lufs = target_lufs
         self.highpass_freq = highpass_freq
         self.lowpass_freq = lowpass_freq
         self.sample_rate = sample_rate
+        self.mode = mode
+
+        # Invariant part of every FFmpeg command, built once
+        self._filter_chain = self._build_filter_chain()
+        self._static_args = (
+            "-af", self._filter_chain,
+            "-ar", str(self.sample_rate),  # Resample to 16kHz
+            "-ac", "1",  # Convert to mono
+            "-c:a", "pcm_s16le",  # 16-bit PCM
+            "-y",  # Overwrite output
+        )
 
         # Check FFmpeg availability
         self._check_ffmpeg()
@@ -124,30 +158,10 @@ class AudioPreprocessor:
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Processing audio: {input_file}")
-        start_time = datetime.now()
-
-        # Build FFmpeg filter chain
-        filters = [
-            # High-pass filter (remove low-frequency rumble)
-            f"highpass=f={self.highpass_freq}",
-            # Low-pass filter (remove high-frequency noise)
-            f"lowpass=f={self.lowpass_freq}",
-            # Loudness normalization
-            f"loudnorm=I={self.target_lufs}:TP=-1.5:LRA=11",
-        ]
-        filter_chain = ",".join(filters)
+        start_time = time.perf_counter()
 
-        # FFmpeg command
-        cmd = [
-            "ffmpeg",
-            "-i", str(input_path),
-            "-af", filter_chain,
-            "-ar", str(self.sample_rate),  # Resample to 16kHz
-            "-ac", "1",  # Convert to mono
-            "-c:a", "pcm_s16le",  # 16-bit PCM
-            "-y",  # Overwrite output
-            str(output_path)
-        ]
+        # FFmpeg command (only the paths vary per call)
+        cmd = ("ffmpeg", "-i", str(input_path), *self._static_args, str(output_path))
 
         try:
             # Run FFmpeg
@@ -163,14 +177,15 @@ class AudioPreprocessor:
                 raise RuntimeError(f"FFmpeg processing failed: {result.stderr}")
 
             # Calculate statistics
-            end_time = datetime.now()
-            processing_time = (end_time - start_time).total_seconds()
+            processing_time = time.perf_counter() - start_time
 
             input_size_mb = input_path.stat().st_size / (1024 * 1024)
             output_size_mb = output_path.stat().st_size / (1024 * 1024)
 
-            # Get audio duration
-            duration = self._get_audio_duration(str(output_path))
+            # Get audio duration (from FFmpeg's own log; ffprobe only as fallback)
+            duration = self._parse_duration_from_stderr(result.stderr)
+            if duration is None:
+                duration = self._get_audio_duration(str(output_path))
             speed_factor = duration / processing_time if processing_time > 0 else 0
 
             metadata = {
@@ -186,7 +201,8 @@ class AudioPreprocessor:
                 "filters_applied": {
                     "highpass_hz": self.highpass_freq,
                     "lowpass_hz": self.lowpass_freq,
-                    "target_lufs": self.target_lufs,
+                    "normalization": self.mode,
+                    "target_lufs": self.target_lufs if self.mode == "loudnorm" else None,
                 },
                 "timestamp": datetime.now().isoformat(),
             }
@@ -194,8 +210,11 @@ class AudioPreprocessor:
             # Save metadata if requested
             if save_metadata:
                 metadata_file = output_path.parent / f"{output_path.stem}_metadata.json"
-                with open(metadata_file, 'w', encoding='utf-8') as f:
-                    json.dump(metadata, f, indent=2, ensure_ascii=False)
+                if orjson is not None:
+                    payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                else:
+                    payload = json.dumps(metadata, indent=2, ensure_ascii=False).encode('utf-8')
+                metadata_file.write_bytes(payload)
                 metadata["metadata_file"] = str(metadata_file)
                 logger.info(f"Metadata saved to: {metadata_file}")
 
@@ -212,6 +231,179 @@ class AudioPreprocessor:
             logger.error(f"Preprocessing failed: {e}")
             raise
 
+    def _build_filter_chain(self) -> str:
+        """Build the FFmpeg audio filter chain string."""
+        filters = [
+            # High-pass filter (remove low-frequency rumble)
+            f"highpass=f={self.highpass_freq}",
+            # Low-pass filter (remove high-frequency noise)
+            f"lowpass=f={self.lowpass_freq}",
+            # Loudness normalization
+            (
+                f"loudnorm=I={self.target_lufs}:TP=-1.5:LRA=11"
+                if self.mode == "loudnorm"
+                else "dynaudnorm=f=200:g=5"
+            ),
+        ]
+        return ",".join(filters)
+
+    def process_to_buffer(
+        self,
+        input_file: str,
+        dtype: str = "int16",
+        enhance: bool = True,
+        max_seconds: Optional[float] = None,
+    ):
+        """
+        Process audio file with enhancement filters straight into memory.
+
+        Same filters as process(), but FFmpeg writes raw PCM to a pipe instead
+        of a WAV file, so in-process callers skip the intermediate file.
+
+        Args:
+            input_file: Path to input audio file
+            dtype: Sample format - "int16" or "float32"
+            enhance: Apply the enhancement filters (False only resamples to
+                mono at self.sample_rate)
+            max_seconds: Only decode the first max_seconds of audio
+
+        Returns:
+            1-D numpy array of mono samples at self.sample_rate
+
+        Raises:
+            FileNotFoundError: If input file doesn't exist
+            RuntimeError: If FFmpeg processing fails
+        """
+        import numpy as np
+
+        formats = {"int16": "s16le", "float32": "f32le"}
+        if dtype not in formats:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+
+        input_path = Path(input_file)
+        if not input_path.exists():
+            raise FileNotFoundError(f"Input file not found: {input_file}")
+
+        # Nothing to do for a 16-bit mono WAV already at the target rate
+        if not enhance and max_seconds is None and dtype == "int16":
+            samples = self._read_wav_passthrough(input_path)
+            if samples is not None:
+                logger.info(f"Input already {self.sample_rate} Hz mono PCM, reading as-is: {input_file}")
+                return samples
+
+        logger.info(f"Processing audio to buffer: {input_file}")
+
+        cmd = ["ffmpeg", "-i", str(input_path)]
+        if max_seconds is not None:
+            cmd += ["-t", str(max_seconds)]
+        if enhance:
+            cmd += ["-af", self._filter_chain]
+        cmd += [
+            "-ar", str(self.sample_rate),
+            "-ac", "1",
+            "-f", formats[dtype],
+            "pipe:1"
+        ]
+
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            stdout, stderr = process.communicate(timeout=3600)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise RuntimeError("FFmpeg processing timed out (>1 hour)")
+
+        if process.returncode != 0:
+            error = stderr.decode("utf-8", errors="replace")
+            logger.error(f"FFmpeg error: {error}")
+            raise RuntimeError(f"FFmpeg processing failed: {error}")
+
+        samples = np.frombuffer(stdout, dtype=np.dtype(dtype))
+        logger.info(
+            f"✅ Preprocessing complete: {len(samples) / self.sample_rate:.1f}s of audio in memory"
+        )
+        return samples
+
+    def _read_wav_passthrough(self, input_path: Path):
+        """
+        Read a WAV that needs no conversion without going through FFmpeg.
+
+        Args:
+            input_path: Path to input audio file
+
+        Returns:
+            int16 numpy array, or None if the file is not 16-bit mono PCM
+            WAV at self.sample_rate
+        """
+        import numpy as np
+
+        if input_path.suffix.lower() not in (".wav", ".wave"):
+            return None
+        try:
+            with wave.open(str(input_path), "rb") as wav:
+                if (
+                    wav.getframerate() != self.sample_rate
+                    or wav.getnchannels() != 1
+                    or wav.getsampwidth() != 2
+                ):
+                    return None
+                return np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        except (wave.Error, EOFError):
+            # Not plain PCM (e.g. float WAV); let FFmpeg handle it
+            return None
+
+    def estimate_snr(self, input_file: str, seconds: float = 1.0) -> float:
+        """
+        Cheap signal-to-noise estimate from the start of a file.
+
+        Splits the first `seconds` of audio into 20 ms frames and compares
+        loud frames (90th percentile RMS) against quiet ones (10th
+        percentile RMS), which stand in for the noise floor. Digitally
+        silent frames (leading silence in exported files) say nothing about
+        the noise floor and are left out.
+
+        Args:
+            input_file: Path to input audio file
+            seconds: How much audio to analyze
+
+        Returns:
+            Estimated SNR in dB (0.0 if there is too little non-silent audio,
+            so enhancement still runs)
+        """
+        import numpy as np
+
+        samples = self.process_to_buffer(
+            input_file, dtype="float32", enhance=False, max_seconds=seconds
+        )
+        frame = self.sample_rate // 50
+        if len(samples) < frame * 10:
+            return 0.0
+
+        frames = samples[: len(samples) // frame * frame].reshape(-1, frame)
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        rms = rms[rms >= _SILENT_FRAME_RMS]
+        if len(rms) < 10:
+            return 0.0
+        noise, signal = np.percentile(rms, [10, 90])
+        return float(20 * np.log10(max(signal, 1e-10) / max(noise, 1e-10)))
+
+    @staticmethod
+    def _parse_duration_from_stderr(stderr: str) -> Optional[float]:
+        """
+        Extract input duration from FFmpeg's stderr.
+
+        Args:
+            stderr: Captured FFmpeg stderr
+
+        Returns:
+            Duration in seconds, or None if not reported (e.g. "N/A")
+        """
+        match = _DURATION_RE.search(stderr or "")
+        if not match:
+            return None
+        hours, minutes, seconds = match.groups()
+        return int(hours) * 3600 + int(minutes) * 60 + float(seconds)
+
     def _get_audio_duration(self, audio_file: str) -> float:
         """
         Get audio duration in seconds using FFprobe.
@@ -241,47 +433,60 @@ class AudioPreprocessor:
             logger.warning(f"Could not get audio duration: {e}")
             return 0.0
 
+    def _process_one(self, input_file: str, output_file: Optional[str]) -> Dict[str, Any]:
+        """Process a single file for batch_process, returning an error dict on failure."""
+        try:
+            return self.process(input_file, output_file)
+        except Exception as e:
+            logger.error(f"Failed to process {input_file}: {e}")
+            return {
+                "input_file": input_file,
+                "error": str(e),
+                "success": False
+            }
+
     def batch_process(
         self,
         input_files: list[str],
         output_dir: Optional[str] = None,
+        workers: Optional[int] = None,
     ) -> list[Dict[str, Any]]:
         """
         Process multiple audio files in batch.
 
+        Each file is an independent FFmpeg subprocess, so files are processed
+        concurrently from a thread pool (threads only wait on the children).
+
         Args:
             input_files: List of input file paths
             output_dir: Directory for output files (default: same as input)
+            workers: Concurrent FFmpeg processes (default: half the CPU cores,
+                leaving the rest for FFmpeg's own threads and MLX feeding)
 
         Returns:
-            List of metadata dicts for each processed file
+            List of metadata dicts for each processed file (input order)
         """
-        results = []
-
-        for idx, input_file in enumerate(input_files, 1):
-            logger.info(f"Processing {idx}/{len(input_files)}: {input_file}")
-
-            # Determine output file
-            if output_dir:
-                output_dir_path = Path(output_dir)
-                output_dir_path.mkdir(parents=True, exist_ok=True)
-                input_path = Path(input_file)
-                output_file = str(output_dir_path / f"{input_path.stem}_enhanced.wav")
-            else:
-                output_file = None
-
-            try:
-                result = self.process(input_file, output_file)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to process {input_file}: {e}")
-                results.append({
-                    "input_file": input_file,
-                    "error": str(e),
-                    "success": False
-                })
-
-        return results
+        if not input_files:
+            return []
+
+        if output_dir:
+            output_dir_path = Path(output_dir)
+            output_dir_path.mkdir(parents=True, exist_ok=True)
+            output_files = [
+                str(output_dir_path / f"{Path(input_file).stem}_enhanced.wav")
+                for input_file in input_files
+            ]
+        else:
+            output_files = [None] * len(input_files)
+
+        if workers is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+        workers = min(workers, len(input_files))
+
+        logger.info(f"Processing {len(input_files)} files with {workers} workers")
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self._process_one, input_files, output_files))
 
 
 if __name__ == "__main__":
@@ -34,15 +34,17 @@ Benefits:
 import logging
 import gc
 import json
-import threading
+import os
 import queue
+import threading
+import time
 import tempfile
 import shutil
+from collections import OrderedDict, deque
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
-from datetime import datetime
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
 import multiprocessing as mp
 
 from .audio_preprocessing import AudioPreprocessor
@@ -50,6 +52,29 @@ from .smart_chunking import SmartChunker
 
 logger = logging.getLogger(__name__)
 
+# How often preprocessing workers scan the chunks directory for new chunks
+_CHUNK_POLL_INTERVAL = 0.1
+
+# RAM-backed filesystem for temp chunk dirs (Linux); chunks of an hour of
+# 16 kHz mono int16 audio need ~130 MB of RAM while a file is in flight
+_RAM_TEMP_DIR = "/dev/shm"
+
+# Imported once in the forkserver so every preprocessing worker forks with
+# them already loaded
+_FORKSERVER_PRELOAD = [
+    "numpy",
+    f"{__package__}.audio_preprocessing",
+    f"{__package__}.smart_chunking",
+]
+
+# Per-worker queue for streaming (job_id, chunk_path) to the orchestrator,
+# installed by the pool initializer (queues cannot be passed to submit())
+_CHUNK_QUEUE = None
+
+# Per-worker preprocessor / chunker instances, reused across files
+_PREPROC_CACHE: Optional[AudioPreprocessor] = None
+_CHUNKER_CACHE: Dict[Tuple[int, int], SmartChunker] = {}
+
 
 @dataclass
 class PipelineJob:
@@ -62,8 +87,29 @@ class PipelineJob:
     total_chunks: int = 0
     processed_chunks: int = 0
     error: Optional[str] = None
-    start_time: Optional[datetime] = None
-    end_time: Optional[datetime] = None
+    start_time: Optional[float] = None  # time.monotonic()
+    end_time: Optional[float] = None  # time.monotonic()
+
+
+class JobFormatter(logging.Formatter):
+    """Formatter for preprocessing logs; records carry job_id via `extra`."""
+
+    def __init__(self):
+        super().__init__('%(asctime)s - [Preprocess Job %(job_id)s] - %(message)s', datefmt='%H:%M:%S')
+
+
+_JOB_FORMATTER = JobFormatter()
+
+
+def _get_worker_logger() -> logging.Logger:
+    """Get the preprocessing worker logger, configuring it once per process."""
+    worker_logger = logging.getLogger("preprocess_worker")
+    if not worker_logger.handlers:
+        worker_logger.setLevel(logging.INFO)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(_JOB_FORMATTER)
+        worker_logger.addHandler(stream_handler)
+    return worker_logger
 
 
 class PreprocessWorker:
@@ -77,10 +123,16 @@ class PreprocessWorker:
         chunk_duration: int = 20,
         overlap_duration: int = 3,
         enable_noise_reduction: bool = True,
+        chunk_dtype: str = "int16",
+        snr_threshold_db: float = 30.0,
     ):
         self.chunk_duration = chunk_duration
         self.overlap_duration = overlap_duration
         self.enable_noise_reduction = enable_noise_reduction
+        # Sample format pulled from FFmpeg; chunks are written as 16-bit PCM
+        self.chunk_dtype = chunk_dtype
+        # Audio already cleaner than this skips the enhancement filters
+        self.snr_threshold_db = snr_threshold_db
 
     def process(
         self,
@@ -99,12 +151,15 @@ class PreprocessWorker:
         Returns:
             Dictionary with preprocessing results
         """
-        import time
-        start_time = time.time()
+        start_time = time.monotonic()
 
         # Setup logging for this worker
         log_file = Path("/tmp") / f"preprocess_job_{job_id}.log"
-        worker_logger = self._setup_logger(job_id, log_file)
+        file_handler = logging.FileHandler(log_file, mode='w')
+        file_handler.setFormatter(_JOB_FORMATTER)
+        base_logger = _get_worker_logger()
+        base_logger.addHandler(file_handler)
+        worker_logger = logging.LoggerAdapter(base_logger, {'job_id': job_id})
 
         worker_logger.info(f"=" * 50)
         worker_logger.info(f"PREPROCESS JOB {job_id} STARTED")
@@ -112,34 +167,58 @@ class PreprocessWorker:
         worker_logger.info(f"=" * 50)
 
         try:
-            # Step 1: Audio preprocessing
+            # Step 1: Audio preprocessing (kept in memory, no enhanced.wav)
             worker_logger.info("Step 1: Audio enhancement...")
-            preprocessor = AudioPreprocessor()
-            enhanced_file = output_dir / "enhanced.wav"
-
-            preprocess_result = preprocessor.process(
-                input_file=str(input_file),
-                output_file=str(enhanced_file),
-                save_metadata=True
+            preprocessor = self._get_preprocessor()
+            enhance_start = time.monotonic()
+
+            enhance = self.enable_noise_reduction
+            if enhance:
+                snr = preprocessor.estimate_snr(str(input_file))
+                if snr >= self.snr_threshold_db:
+                    worker_logger.info(f"SNR {snr:.1f} dB - clean audio, skipping enhancement")
+                    enhance = False
+
+            samples = preprocessor.process_to_buffer(
+                str(input_file), dtype=self.chunk_dtype, enhance=enhance
+            )
+            enhance_time = time.monotonic() - enhance_start
+            audio_seconds = len(samples) / preprocessor.sample_rate
+            worker_logger.info(
+                f"✓ Enhanced: {audio_seconds / enhance_time if enhance_time > 0 else 0:.1f}x realtime"
             )
-            worker_logger.info(f"✓ Enhanced: {preprocess_result['speed_factor']:.1f}x realtime")
 
             # Step 2: Smart chunking
             worker_logger.info("Step 2: Smart chunking...")
-            chunker = SmartChunker(
-                chunk_duration=self.chunk_duration,
-                overlap_duration=self.overlap_duration
-            )
+            chunker = self._get_chunker()
             chunks_dir = output_dir / "chunks"
 
-            chunk_result = chunker.process(
-                input_file=str(enhanced_file),
-                output_dir=str(chunks_dir),
-                save_metadata=True
-            )
+            # Stream chunks to the orchestrator as they are written
+            stop_watch = threading.Event()
+            watcher = None
+            if _CHUNK_QUEUE is not None:
+                watcher = threading.Thread(
+                    target=_watch_chunks,
+                    args=(chunks_dir, job_id, _CHUNK_QUEUE, stop_watch),
+                    daemon=True,
+                )
+                watcher.start()
+
+            try:
+                chunk_result = chunker.process_samples(
+                    samples,
+                    sample_rate=preprocessor.sample_rate,
+                    output_dir=str(chunks_dir),
+                    save_metadata=True,
+                    input_file=str(input_file),
+                )
+            finally:
+                stop_watch.set()
+                if watcher is not None:
+                    watcher.join()
             worker_logger.info(f"✓ Created {chunk_result['total_chunks']} chunks")
 
-            total_time = time.time() - start_time
+            total_time = time.monotonic() - start_time
             worker_logger.info(f"=" * 50)
             worker_logger.info(f"PREPROCESS COMPLETED in {total_time:.1f}s")
             worker_logger.info(f"=" * 50)
@@ -161,36 +240,91 @@ class PreprocessWorker:
                 'job_id': job_id,
                 'error': str(e),
             }
+        finally:
+            base_logger.removeHandler(file_handler)
+            file_handler.close()
+
+    @staticmethod
+    def _get_preprocessor() -> AudioPreprocessor:
+        """Get this process's AudioPreprocessor, creating it on first use."""
+        global _PREPROC_CACHE
+        if _PREPROC_CACHE is None:
+            _PREPROC_CACHE = AudioPreprocessor()
+        return _PREPROC_CACHE
+
+    def _get_chunker(self) -> SmartChunker:
+        """Get this process's SmartChunker for the configured chunk sizes."""
+        key = (self.chunk_duration, self.overlap_duration)
+        chunker = _CHUNKER_CACHE.get(key)
+        if chunker is None:
+            chunker = _CHUNKER_CACHE[key] = SmartChunker(
+                chunk_duration=self.chunk_duration,
+                overlap_duration=self.overlap_duration
+            )
+        return chunker
 
-    def _setup_logger(self, job_id: int, log_file: Path) -> logging.Logger:
-        """Setup a file logger for this worker."""
-        logger_name = f"preprocess_worker_{job_id}"
-        worker_logger = logging.getLogger(logger_name)
-        worker_logger.setLevel(logging.INFO)
-        worker_logger.handlers = []
 
-        # File handler
-        file_handler = logging.FileHandler(log_file, mode='w')
-        formatter = logging.Formatter('%(asctime)s - [Preprocess %(job_id)s] - %(message)s', datefmt='%H:%M:%S')
+def _remove_dirs(dirs: List[Path]) -> None:
+    """Delete temp directories (runs on a background cleanup thread)."""
+    for path in dirs:
+        shutil.rmtree(path, ignore_errors=True)
 
-        class JobFormatter(logging.Formatter):
-            def __init__(self, job_id):
-                super().__init__('%(asctime)s - [Preprocess Job %(job_id)s] - %(message)s', datefmt='%H:%M:%S')
-                self.job_id = job_id
 
-            def format(self, record):
-                record.job_id = self.job_id
-                return super().format(record)
+def _preproc_init(chunk_queue=None) -> None:
+    """
+    Initializer for the persistent preprocessing pool.
 
-        file_handler.setFormatter(JobFormatter(job_id))
-        worker_logger.addHandler(file_handler)
+    Imports the preprocessing modules once when the worker starts, so the
+    first job submitted to a fresh worker does not pay the import cost.
 
-        # Stream handler
-        stream_handler = logging.StreamHandler()
-        stream_handler.setFormatter(JobFormatter(job_id))
-        worker_logger.addHandler(stream_handler)
+    Args:
+        chunk_queue: Queue that receives (job_id, chunk_path) for each
+            finished chunk
+    """
+    global _CHUNK_QUEUE
+    _CHUNK_QUEUE = chunk_queue
+    from . import audio_preprocessing, smart_chunking  # noqa: F401
 
-        return worker_logger
+
+def _watch_chunks(
+    chunks_dir: Path,
+    job_id: int,
+    chunk_queue,
+    stop: threading.Event,
+) -> None:
+    """
+    Poll a chunks directory and report each chunk once it is complete.
+
+    SmartChunker writes chunks one at a time in order, so a chunk is
+    complete as soon as the next one appears; the remaining chunks are
+    reported once chunking has stopped.
+    """
+    reported = set()
+
+    def scan() -> List[str]:
+        chunks = []
+        try:
+            with os.scandir(chunks_dir) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if stem.startswith("chunk_") and stem[6:].isdecimal() and ext in (".wav", ".mp3"):
+                        chunks.append((int(stem[6:]), entry.path))
+        except FileNotFoundError:
+            return []
+        # By chunk number: chunk_1000 comes after chunk_999, not before chunk_101
+        return [path for _, path in sorted(chunks)]
+
+    while True:
+        finished = stop.wait(_CHUNK_POLL_INTERVAL)
+        paths = scan()
+        if not finished:
+            paths = paths[:-1]
+        for path in paths:
+            if path not in reported:
+                reported.add(path)
+                chunk_queue.put((job_id, path))
+        if finished:
+            return
 
 
 def _preprocess_worker_function(
@@ -199,6 +333,7 @@ def _preprocess_worker_function(
     job_id: int,
     chunk_duration: int,
     overlap_duration: int,
+    chunk_dtype: str = "int16",
 ) -> Dict[str, Any]:
     """
     Standalone function for ProcessPoolExecutor.
@@ -206,6 +341,7 @@ def _preprocess_worker_function(
     worker = PreprocessWorker(
         chunk_duration=chunk_duration,
         overlap_duration=overlap_duration,
+        chunk_dtype=chunk_dtype,
     )
     return worker.process(
         input_file=Path(input_file),
@@ -226,25 +362,43 @@ class TranscribeWorker:
         language: str = "th",
         num_processes: int = 2,
         workers_per_process: int = 8,
+        transcriber_cls=None,
     ):
         self.model = model
         self.language = language
         self.num_processes = num_processes
         self.workers_per_process = workers_per_process
+        # Already-imported HybridMLXTranscriber class, if the caller preloaded it
+        self._transcriber_cls = transcriber_cls
         self._transcriber = None
+        # Used from both the transcribe thread and the chunk listener
+        self._transcriber_lock = threading.Lock()
 
     def _get_transcriber(self):
         """Lazy load transcriber."""
-        if self._transcriber is None:
-            # Import here to avoid loading MLX until needed
-            from .transcription_hybrid import HybridMLXTranscriber
-            self._transcriber = HybridMLXTranscriber(
-                model=self.model,
-                language=self.language,
-                num_processes=self.num_processes,
-                workers_per_process=self.workers_per_process,
-            )
-        return self._transcriber
+        with self._transcriber_lock:
+            if self._transcriber is None:
+                HybridMLXTranscriber = self._transcriber_cls
+                if HybridMLXTranscriber is None:
+                    # Import here to avoid loading MLX until needed
+                    from .transcription_hybrid import HybridMLXTranscriber
+                self._transcriber = HybridMLXTranscriber(
+                    model=self.model,
+                    language=self.language,
+                    num_processes=self.num_processes,
+                    workers_per_process=self.workers_per_process,
+                )
+            return self._transcriber
+
+    def submit_chunks(self, chunk_files: List[Path]) -> Future:
+        """
+        Start transcribing finished chunks of a file that is still being chunked.
+
+        Returns:
+            Future to pass (per chunk path) as `streamed` to transcribe() /
+            transcribe_many()
+        """
+        return self._get_transcriber().submit_chunks(chunk_files)
 
     def transcribe(
         self,
@@ -252,6 +406,9 @@ class TranscribeWorker:
         output_file: Path,
         metadata_file: Optional[Path] = None,
         job_id: int = 0,
+        generate_srt: bool = True,
+        generate_json: bool = True,
+        streamed: Optional[Dict[str, Future]] = None,
     ) -> Dict[str, Any]:
         """
         Transcribe chunks directory.
@@ -261,6 +418,9 @@ class TranscribeWorker:
             output_file: Output text file path
             metadata_file: Chunking metadata file
             job_id: Job identifier for logging
+            generate_srt: Also write an SRT subtitle file
+            generate_json: Also write a JSON result file
+            streamed: Chunk path -> future from submit_chunks()
 
         Returns:
             Dictionary with transcription results
@@ -272,13 +432,105 @@ class TranscribeWorker:
             input_dir=str(chunks_dir),
             output_file=str(output_file),
             metadata_file=str(metadata_file) if metadata_file else None,
-            generate_srt=True,
-            generate_json=True,
+            generate_srt=generate_srt,
+            generate_json=generate_json,
+            streamed=streamed,
         )
 
         logger.info(f"[Transcribe Job {job_id}] Completed: {result['success_rate']:.1f}% success")
         return result
 
+    def transcribe_many(
+        self,
+        items: List[Tuple[Path, Path, Optional[Path], int]],
+        generate_srt: bool = True,
+        generate_json: bool = True,
+        streamed: Optional[Dict[str, Future]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several chunks directories in one MLX pass.
+
+        Args:
+            items: List of (chunks_dir, output_file, metadata_file, job_id)
+            generate_srt: Also write an SRT subtitle file per item
+            generate_json: Also write a JSON result file per item
+            streamed: Chunk path -> future from submit_chunks()
+
+        Returns:
+            One transcription result per item, in the same order
+        """
+        job_ids = [job_id for _, _, _, job_id in items]
+        logger.info(f"[Transcribe Jobs {job_ids}] Starting batched transcription...")
+
+        transcriber = self._get_transcriber()
+        results = transcriber.transcribe_many(
+            [
+                (str(chunks_dir), str(output_file), str(metadata_file) if metadata_file else None)
+                for chunks_dir, output_file, metadata_file, _ in items
+            ],
+            generate_srt=generate_srt,
+            generate_json=generate_json,
+            streamed=streamed,
+        )
+
+        for job_id, result in zip(job_ids, results):
+            logger.info(f"[Transcribe Job {job_id}] Completed: {result['success_rate']:.1f}% success")
+        return results
+
+
+class _Handoff:
+    """
+    Bounded FIFO between the preprocessing stage and the transcribe thread.
+
+    put() blocks while the buffer is full (backpressure on preprocessing);
+    get_batch() hands out items strictly in the order they were put.
+    """
+
+    def __init__(self, maxsize: int):
+        self._items: deque = deque()
+        self._maxsize = max(1, maxsize)
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, item: Tuple[PipelineJob, Dict[str, Any]]) -> None:
+        """Append an item, waiting while the buffer is full."""
+        with self._cond:
+            while len(self._items) >= self._maxsize and not self._closed:
+                self._cond.wait()
+            self._items.append(item)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Signal that no more items will be put."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def get_batch(self, max_items: int, wait: float) -> List[Tuple[PipelineJob, Dict[str, Any]]]:
+        """
+        Take up to max_items items, oldest first.
+
+        Blocks for the first item, then waits up to `wait` seconds for the
+        batch to fill. Returns an empty list once closed and drained.
+        """
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if not self._items:
+                return []
+
+            target = min(max_items, self._maxsize)
+            deadline = time.monotonic() + wait
+            while len(self._items) < target and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+
+            batch = [self._items.popleft() for _ in range(min(max_items, len(self._items)))]
+            self._cond.notify_all()
+            return batch
+
 
 class PipelineTranscriber:
     """
@@ -310,7 +562,10 @@ class PipelineTranscriber:
         workers_per_process: int = 8,
         chunk_duration: int = 20,
         overlap_duration: int = 3,
-        max_preprocess_workers: int = 2,
+        max_preprocess_workers: Optional[int] = None,
+        transcribe_batch_size: int = 4,
+        transcribe_batch_wait: float = 0.5,
+        max_tracked_jobs: int = 1024,
     ):
         """
         Initialize Pipeline Transcriber.
@@ -322,7 +577,12 @@ class PipelineTranscriber:
             workers_per_process: Workers per transcription process
             chunk_duration: Chunk duration in seconds
             overlap_duration: Overlap duration in seconds
-            max_preprocess_workers: Max concurrent preprocessing jobs
+            max_preprocess_workers: Max concurrent preprocessing jobs (default:
+                CPU count minus 2 cores per transcription process, min 1)
+            transcribe_batch_size: Max preprocessed files transcribed in one MLX pass
+            transcribe_batch_wait: Seconds to wait for more files before
+                starting a partial batch
+            max_tracked_jobs: How many recent jobs to keep in self.jobs
         """
         self.model = model
         self.language = language
@@ -330,22 +590,54 @@ class PipelineTranscriber:
         self.workers_per_process = workers_per_process
         self.chunk_duration = chunk_duration
         self.overlap_duration = overlap_duration
+        # Each transcription process keeps ~2 cores busy feeding MLX; the rest
+        # of the machine is left to preprocessing
+        if max_preprocess_workers is None:
+            max_preprocess_workers = max(1, (os.cpu_count() or 4) - num_transcribe_processes * 2)
         self.max_preprocess_workers = max_preprocess_workers
+        self.transcribe_batch_size = max(1, transcribe_batch_size)
+        self.transcribe_batch_wait = transcribe_batch_wait
 
-        # Job tracking
-        self.jobs: Dict[int, PipelineJob] = {}
+        # Job tracking (most recent jobs only, oldest evicted first)
+        self.jobs: "OrderedDict[int, PipelineJob]" = OrderedDict()
         self.job_counter = 0
-
-        # Queues
-        self.preprocess_queue = queue.Queue()
-        self.transcribe_queue = queue.Queue()
+        self.max_tracked_jobs = max(1, max_tracked_jobs)
+
+        # Persistent preprocessing pool (created on first process_batch)
+        self._preprocess_pool: Optional[ProcessPoolExecutor] = None
+
+        # Chunks streamed back from the preprocessing workers, fed to
+        # transcription while the rest of the file is still being chunked
+        self._chunk_queue = None
+        self._chunk_listener: Optional[threading.Thread] = None
+        # job_id -> {chunk path: transcription future} until the job is
+        # handed to the transcribe thread
+        self._streamed: Dict[int, Dict[str, Future]] = {}
+        self._streamed_lock = threading.Lock()
+        self._transcribe_worker_lock = threading.Lock()
+
+        # Background temp-dir removals, joined on close()
+        self._cleanup_threads: List[threading.Thread] = []
+
+        # Resident transcribe worker (created on first process_batch)
+        self._transcribe_worker: Optional[TranscribeWorker] = None
+
+        # Import the transcription module in the background, overlapping it
+        # with the first file's preprocessing
+        self._HybridMLXTranscriber = None
+        self._mlx_preload = threading.Thread(
+            target=self._preload_mlx,
+            name="pipeline-mlx-preload",
+            daemon=True,
+        )
+        self._mlx_preload.start()
 
         logger.info("=" * 70)
         logger.info("🚀 PIPELINE TRANSCRIBER INITIALIZED")
         logger.info("=" * 70)
         logger.info(f"Model: {model}")
         logger.info(f"Transcription: {num_transcribe_processes} proc × {workers_per_process} workers")
-        logger.info(f"Preprocessing: {max_preprocess_workers} parallel workers")
+        logger.info(f"Preprocessing: {self.max_preprocess_workers} parallel workers")
         logger.info(f"Chunking: {chunk_duration}s + {overlap_duration}s overlap")
         logger.info("=" * 70)
 
@@ -353,19 +645,23 @@ class PipelineTranscriber:
         self,
         file_pairs: List[Tuple[str, str]],
         temp_base: Optional[str] = None,
+        generate_srt: bool = True,
+        generate_json: bool = True,
     ) -> List[Dict[str, Any]]:
         """
         Process multiple files with overlapped execution.
 
         Args:
             file_pairs: List of (input_file, output_file) tuples
-            temp_base: Base directory for temp files
+            temp_base: Base directory for temp files (default: /dev/shm when
+                writable, so chunks stay in RAM; otherwise the system temp dir)
+            generate_srt: Also write an SRT subtitle file per output
+            generate_json: Also write a JSON result file per output
 
         Returns:
             List of results for each file
         """
-        import time
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(f"📋 Starting batch processing: {len(file_pairs)} files")
 
@@ -377,96 +673,119 @@ class PipelineTranscriber:
             logger.info(f"  Job {job.job_id}: {Path(input_file).name}")
 
         # Create temp directories
+        ram_dir = _RAM_TEMP_DIR if os.access(_RAM_TEMP_DIR, os.W_OK) else None
         temp_dirs = {}
         for job in jobs:
             if temp_base:
                 temp_dir = Path(temp_base) / f"job_{job.job_id}"
                 temp_dir.mkdir(parents=True, exist_ok=True)
             else:
-                temp_dir = Path(tempfile.mkdtemp(prefix=f"pipeline_job_{job.job_id}_"))
+                temp_dir = Path(tempfile.mkdtemp(prefix=f"pipeline_job_{job.job_id}_", dir=ram_dir))
             temp_dirs[job.job_id] = temp_dir
 
         results = []
+        preprocess_futures: Dict[Future, PipelineJob] = {}
 
         try:
             # Pipeline execution
-            with ProcessPoolExecutor(max_workers=self.max_preprocess_workers) as preprocess_executor:
-                # Submit all preprocessing jobs
-                preprocess_futures: Dict[Future, PipelineJob] = {}
-                for job in jobs:
-                    future = preprocess_executor.submit(
-                        _preprocess_worker_function,
-                        str(job.input_file),
-                        str(temp_dirs[job.job_id]),
-                        job.job_id,
-                        self.chunk_duration,
-                        self.overlap_duration,
-                    )
-                    preprocess_futures[future] = job
-                    job.status = "preprocessing"
-                    logger.info(f"[Job {job.job_id}] Preprocessing started (CPU)")
-
-                # Create transcribe worker (lazy load MLX)
-                transcribe_worker = TranscribeWorker(
-                    model=self.model,
-                    language=self.language,
-                    num_processes=self.num_transcribe_processes,
-                    workers_per_process=self.workers_per_process,
+            preprocess_executor = self._get_preprocess_pool()
+
+            # Submit all preprocessing jobs, largest file first (LPT scheduling:
+            # file size is a cheap proxy for duration and shortens the makespan)
+            for job in sorted(jobs, key=self._input_size, reverse=True):
+                with self._streamed_lock:
+                    self._streamed[job.job_id] = {}
+                future = preprocess_executor.submit(
+                    _preprocess_worker_function,
+                    str(job.input_file),
+                    str(temp_dirs[job.job_id]),
+                    job.job_id,
+                    self.chunk_duration,
+                    self.overlap_duration,
                 )
-
-                # Process as preprocessing completes
-                from concurrent.futures import as_completed
-                for future in as_completed(preprocess_futures):
-                    job = preprocess_futures[future]
-                    preprocess_result = future.result()
-
-                    if preprocess_result['success']:
-                        job.status = "transcribing"
-                        job.chunks_dir = Path(preprocess_result['chunks_dir'])
-                        job.total_chunks = preprocess_result['total_chunks']
-
-                        logger.info(f"[Job {job.job_id}] Preprocessing done, starting transcription (GPU)")
-
-                        # Start transcription (this will use GPU)
-                        transcribe_result = transcribe_worker.transcribe(
-                            chunks_dir=job.chunks_dir,
-                            output_file=job.output_file,
-                            metadata_file=Path(preprocess_result['metadata_file']),
-                            job_id=job.job_id,
-                        )
-
-                        job.status = "completed"
-                        job.end_time = datetime.now()
-
-                        results.append({
-                            'job_id': job.job_id,
-                            'input_file': str(job.input_file),
-                            'output_file': str(job.output_file),
-                            'success': True,
-                            'preprocess_time': preprocess_result['preprocess_time'],
-                            'transcribe_result': transcribe_result,
-                        })
-
-                        logger.info(f"[Job {job.job_id}] ✅ COMPLETED")
-
-                    else:
-                        job.status = "failed"
-                        job.error = preprocess_result.get('error', 'Unknown error')
-                        results.append({
-                            'job_id': job.job_id,
-                            'input_file': str(job.input_file),
-                            'success': False,
-                            'error': job.error,
-                        })
-                        logger.error(f"[Job {job.job_id}] ❌ FAILED: {job.error}")
+                preprocess_futures[future] = job
+                job.status = "preprocessing"
+                logger.info(f"[Job {job.job_id}] Preprocessing started (CPU)")
+
+            # Transcribe worker is kept across batches (MLX model stays loaded)
+            transcribe_worker = self._get_transcribe_worker()
+
+            # Preprocessed jobs are handed, in completion order, to a dedicated
+            # transcribe thread so the GPU stage runs while further files are
+            # still preprocessing
+            handoff = _Handoff(maxsize=self.max_preprocess_workers)
+            results_lock = threading.Lock()
+
+            def transcribe_loop() -> None:
+                while True:
+                    # Group files that finish preprocessing close together
+                    batch = handoff.get_batch(self.transcribe_batch_size, self.transcribe_batch_wait)
+                    if not batch:
+                        return
+                    batch_results = self._transcribe_jobs(
+                        transcribe_worker, batch, generate_srt, generate_json
+                    )
+                    with results_lock:
+                        results.extend(batch_results)
+
+            consumer = threading.Thread(target=transcribe_loop, name="pipeline-transcribe", daemon=True)
+            consumer.start()
+
+            try:
+                # Process as preprocessing completes, handing over every job
+                # that is ready at once so they can share a transcribe batch
+                pending = set(preprocess_futures)
+                while pending:
+                    done, pending = wait(
+                        pending,
+                        timeout=self.transcribe_batch_wait,
+                        return_when=FIRST_COMPLETED,
+                    )
+                    for future in sorted(done, key=lambda f: preprocess_futures[f].job_id):
+                        job = preprocess_futures[future]
+                        preprocess_result = future.result()
+
+                        # Chunks arriving from now on are left to the transcribe thread
+                        streamed = self._take_streamed(job.job_id)
+                        if preprocess_result['success']:
+                            preprocess_result['streamed'] = streamed
+                            job.chunks_dir = Path(preprocess_result['chunks_dir'])
+                            job.total_chunks = preprocess_result['total_chunks']
+                            logger.info(f"[Job {job.job_id}] Preprocessing done, queued for transcription (GPU)")
+                            handoff.put((job, preprocess_result))
+                        else:
+                            self._cancel_streamed(streamed)
+                            job.status = "failed"
+                            job.error = preprocess_result.get('error', 'Unknown error')
+                            with results_lock:
+                                results.append(self._failed_result(job))
+                            logger.error(f"[Job {job.job_id}] ❌ FAILED: {job.error}")
+            finally:
+                handoff.close()
+                consumer.join()
 
         finally:
-            # Cleanup temp directories
-            for temp_dir in temp_dirs.values():
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir, ignore_errors=True)
+            # The pool outlives this batch: drop queued work before deleting its dirs
+            for future in preprocess_futures:
+                future.cancel()
+            for job in jobs:
+                self._cancel_streamed(self._take_streamed(job.job_id))
+
+            # Cleanup temp directories in the background so results return now
+            cleanup = threading.Thread(
+                target=_remove_dirs,
+                args=(list(temp_dirs.values()),),
+                name="pipeline-cleanup",
+                daemon=True,
+            )
+            cleanup.start()
+            self._cleanup_threads = [t for t in self._cleanup_threads if t.is_alive()]
+            self._cleanup_threads.append(cleanup)
+
+        # Report in input order regardless of completion order
+        results.sort(key=lambda r: r['job_id'])
 
-        total_time = time.time() - start_time
+        total_time = time.monotonic() - start_time
         logger.info("=" * 70)
         logger.info(f"🎉 BATCH COMPLETE: {len(results)}/{len(jobs)} files in {total_time/60:.1f} min")
         logger.info("=" * 70)
@@ -482,6 +801,258 @@ class PipelineTranscriber:
         results = self.process_batch([(input_file, output_file)])
         return results[0] if results else {'success': False, 'error': 'No results'}
 
+    def _transcribe_jobs(
+        self,
+        transcribe_worker: TranscribeWorker,
+        batch: List[Tuple[PipelineJob, Dict[str, Any]]],
+        generate_srt: bool = True,
+        generate_json: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe a group of preprocessed jobs in one MLX pass."""
+        if len(batch) == 1:
+            job, preprocess_result = batch[0]
+            return [self._transcribe_job(
+                transcribe_worker, job, preprocess_result, generate_srt, generate_json
+            )]
+
+        for job, _ in batch:
+            job.status = "transcribing"
+        logger.info(f"[Jobs {[job.job_id for job, _ in batch]}] Starting batched transcription (GPU)")
+        streamed = {}
+        for _, preprocess_result in batch:
+            streamed.update(preprocess_result.get('streamed') or {})
+        try:
+            transcribe_results = transcribe_worker.transcribe_many(
+                [
+                    (job.chunks_dir, job.output_file, Path(preprocess_result['metadata_file']), job.job_id)
+                    for job, preprocess_result in batch
+                ],
+                generate_srt=generate_srt,
+                generate_json=generate_json,
+                streamed=streamed,
+            )
+        except Exception as e:
+            failed = []
+            for job, _ in batch:
+                job.status = "failed"
+                job.error = str(e)
+                logger.error(f"[Job {job.job_id}] ❌ FAILED: {job.error}")
+                failed.append(self._failed_result(job))
+            return failed
+
+        return [
+            self._completed_result(job, preprocess_result, transcribe_result)
+            for (job, preprocess_result), transcribe_result in zip(batch, transcribe_results)
+        ]
+
+    def _transcribe_job(
+        self,
+        transcribe_worker: TranscribeWorker,
+        job: PipelineJob,
+        preprocess_result: Dict[str, Any],
+        generate_srt: bool = True,
+        generate_json: bool = True,
+    ) -> Dict[str, Any]:
+        """Transcribe one preprocessed job and build its result entry."""
+        job.status = "transcribing"
+        logger.info(f"[Job {job.job_id}] Starting transcription (GPU)")
+        try:
+            transcribe_result = transcribe_worker.transcribe(
+                chunks_dir=job.chunks_dir,
+                output_file=job.output_file,
+                metadata_file=Path(preprocess_result['metadata_file']),
+                job_id=job.job_id,
+                generate_srt=generate_srt,
+                generate_json=generate_json,
+                streamed=preprocess_result.get('streamed'),
+            )
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+            logger.error(f"[Job {job.job_id}] ❌ FAILED: {job.error}")
+            return self._failed_result(job)
+
+        return self._completed_result(job, preprocess_result, transcribe_result)
+
+    @staticmethod
+    def _completed_result(
+        job: PipelineJob,
+        preprocess_result: Dict[str, Any],
+        transcribe_result: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Mark a job completed and build its result entry."""
+        job.status = "completed"
+        job.end_time = time.monotonic()
+        logger.info(f"[Job {job.job_id}] ✅ COMPLETED")
+
+        return {
+            'job_id': job.job_id,
+            'input_file': str(job.input_file),
+            'output_file': str(job.output_file),
+            'success': True,
+            'preprocess_time': preprocess_result['preprocess_time'],
+            'total_time': job.end_time - job.start_time,
+            'transcribe_result': transcribe_result,
+        }
+
+    @staticmethod
+    def _input_size(job: PipelineJob) -> int:
+        """Input file size in bytes (0 if it cannot be read)."""
+        try:
+            return job.input_file.stat().st_size
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _failed_result(job: PipelineJob) -> Dict[str, Any]:
+        """Result entry for a job that failed."""
+        return {
+            'job_id': job.job_id,
+            'input_file': str(job.input_file),
+            'success': False,
+            'error': job.error,
+        }
+
+    def _get_preprocess_pool(self) -> ProcessPoolExecutor:
+        """Get the persistent preprocessing pool, creating it on first use."""
+        if self._preprocess_pool is None:
+            ctx = mp.get_context("forkserver")
+            ctx.set_forkserver_preload(_FORKSERVER_PRELOAD)
+            self._chunk_queue = ctx.Queue()
+            self._chunk_listener = threading.Thread(
+                target=self._listen_chunks,
+                name="pipeline-chunks",
+                daemon=True,
+            )
+            self._chunk_listener.start()
+            self._preprocess_pool = ProcessPoolExecutor(
+                max_workers=self.max_preprocess_workers,
+                mp_context=ctx,
+                initializer=_preproc_init,
+                initargs=(self._chunk_queue,),
+            )
+        return self._preprocess_pool
+
+    def _listen_chunks(self) -> None:
+        """Feed chunks streamed from the preprocessing workers to transcription."""
+        while True:
+            items = [self._chunk_queue.get()]
+            # Take whatever else is already queued, so each job's chunks go
+            # to the transcription workers as one batch
+            try:
+                while True:
+                    items.append(self._chunk_queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            by_job: Dict[int, List[str]] = {}
+            for item in items:
+                if item is not None:
+                    job_id, chunk_path = item
+                    by_job.setdefault(job_id, []).append(chunk_path)
+            for job_id, chunk_paths in by_job.items():
+                self._stream_chunks(job_id, chunk_paths)
+            if None in items:
+                return
+
+    def _stream_chunks(self, job_id: int, chunk_paths: List[str]) -> None:
+        """Start transcribing finished chunks of a job that is still being chunked."""
+        job = self.jobs.get(job_id)
+        if job is not None:
+            if job.status == "preprocessing":
+                job.status = "chunking"
+            # Chunk files are numbered from 1 (chunk_001.wav, ...)
+            job.total_chunks = max(job.total_chunks, *(int(Path(p).stem[6:]) for p in chunk_paths))
+
+        with self._streamed_lock:
+            if job_id not in self._streamed:
+                return  # Already handed to the transcribe thread
+
+        # Submitted without the lock: the first submit starts the worker
+        # processes, and the orchestrator must not wait on that to take a job
+        try:
+            future = self._get_transcribe_worker().submit_chunks([Path(p) for p in chunk_paths])
+        except Exception as e:
+            # The transcribe thread picks these chunks up with the rest
+            logger.warning(f"[Job {job_id}] Could not stream chunks: {e}")
+            return
+
+        with self._streamed_lock:
+            streamed = self._streamed.get(job_id)
+            if streamed is not None:
+                for path in chunk_paths:
+                    streamed[path] = future
+        if streamed is None:
+            # Taken meanwhile; the transcribe thread does these chunks itself
+            future.cancel()
+            return
+        logger.debug(f"[Job {job_id}] Streamed {len(chunk_paths)} chunks to transcription")
+
+    def _take_streamed(self, job_id: int) -> Dict[str, Future]:
+        """Stop streaming a job's chunks and return the futures started so far."""
+        with self._streamed_lock:
+            return self._streamed.pop(job_id, None) or {}
+
+    @staticmethod
+    def _cancel_streamed(streamed: Dict[str, Future]) -> None:
+        """Drop streamed transcriptions whose results will not be used."""
+        for future in set(streamed.values()):
+            future.cancel()
+
+    def _preload_mlx(self) -> None:
+        """Import the MLX transcription module (runs on a background thread)."""
+        try:
+            from .transcription_hybrid import HybridMLXTranscriber
+        except Exception as e:
+            # TranscribeWorker imports it again and surfaces the error there
+            logger.warning(f"MLX preload failed: {e}")
+            return
+        self._HybridMLXTranscriber = HybridMLXTranscriber
+
+    def _get_transcribe_worker(self) -> TranscribeWorker:
+        """Get the resident transcribe worker, creating it on first use."""
+        with self._transcribe_worker_lock:
+            if self._transcribe_worker is None:
+                self._mlx_preload.join()
+                self._transcribe_worker = TranscribeWorker(
+                    model=self.model,
+                    language=self.language,
+                    num_processes=self.num_transcribe_processes,
+                    workers_per_process=self.workers_per_process,
+                    transcriber_cls=self._HybridMLXTranscriber,
+                )
+            return self._transcribe_worker
+
+    def close(self) -> None:
+        """Shut down the preprocessing pool, release the MLX model and finish cleanup."""
+        if self._preprocess_pool is not None:
+            self._preprocess_pool.shutdown(wait=True)
+            self._preprocess_pool = None
+
+        if self._chunk_listener is not None:
+            self._chunk_queue.put(None)
+            self._chunk_listener.join()
+            self._chunk_queue.close()
+            self._chunk_listener = None
+            self._chunk_queue = None
+
+        if self._transcribe_worker is not None:
+            if self._transcribe_worker._transcriber is not None:
+                self._transcribe_worker._transcriber.close()
+            self._transcribe_worker._transcriber = None
+            self._transcribe_worker = None
+            gc.collect()
+
+        for cleanup in self._cleanup_threads:
+            cleanup.join()
+        self._cleanup_threads = []
+
+    def __enter__(self) -> "PipelineTranscriber":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def _create_job(self, input_file: Path, output_file: Path) -> PipelineJob:
         """Create a new pipeline job."""
         self.job_counter += 1
@@ -489,7 +1060,9 @@ class PipelineTranscriber:
             job_id=self.job_counter,
             input_file=input_file,
             output_file=output_file,
-            start_time=datetime.now(),
+            start_time=time.monotonic(),
         )
         self.jobs[job.job_id] = job
+        while len(self.jobs) > self.max_tracked_jobs:
+            self.jobs.popitem(last=False)
         return job
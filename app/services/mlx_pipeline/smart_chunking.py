@@ -16,16 +16,318 @@ Benefits:
 - Easier segment merging with overlap detection
 """
 
+import asyncio
 import subprocess
+import contextlib
+import functools
+import hashlib
 import json
 import logging
+import multiprocessing
+import os
+import shutil
+import struct
+import tempfile
+import time
+import wave
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 import math
 
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
+
+try:
+    import av
+except ImportError:  # optional: in-process remuxing, FFmpeg subprocesses otherwise
+    av = None
+
 logger = logging.getLogger(__name__)
 
+# FFmpeg only reports real errors on stderr (no banner or progress spam)
+_FFMPEG_QUIET = ["-hide_banner", "-nostats", "-loglevel", "error"]
+
+# Bytes read from the FFmpeg stdout pipe at a time
+_PIPE_READ_SIZE = 1 << 20
+
+# Compressed inputs whose chunks can be stream-copied instead of re-encoded
+_STREAM_COPY_SUFFIXES = ('.mp3', '.m4a', '.aac', '.ogg', '.opus')
+
+# Probed durations, keyed by file path and validated against size/mtime
+_DURATION_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ttservice" / "duration"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _verify_ffmpeg() -> None:
+    """
+    Verify FFmpeg is installed (once per process).
+
+    A PATH lookup, no subprocess; a failed check is not cached, so it is
+    retried on the next call.
+    """
+    if shutil.which("ffmpeg") is None:
+        raise RuntimeError(
+            "FFmpeg not found. Install with: brew install ffmpeg"
+        )
+
+
+def _ffmpeg_threads(concurrent: bool = False) -> List[str]:
+    """
+    FFmpeg -threads option for one run.
+
+    Runs that share the CPU with other FFmpeg processes, or that run inside
+    a pool worker process, get one thread each so parallelism comes from
+    the pool instead of N x ncpu FFmpeg threads. A lone run uses all cores.
+
+    Args:
+        concurrent: Whether other FFmpeg runs from this call execute in parallel
+
+    Returns:
+        ["-threads", "1"] or ["-threads", "0"] (auto)
+    """
+    if concurrent or multiprocessing.parent_process() is not None:
+        return ["-threads", "1"]
+    return ["-threads", "0"]
+
+
+def _wav_duration(audio_file: str) -> Optional[float]:
+    """
+    Duration of a RIFF/WAVE file read from its header, without FFprobe.
+
+    Returns:
+        Duration in seconds, or None if the header can't be used (not RIFF,
+        no fmt/data chunk, a truncated header, or a streamed file with an
+        unset data size)
+    """
+    with open(audio_file, "rb") as f:
+        header = f.read(12)
+        if len(header) < 12:
+            return None
+        riff, _, wave_id = struct.unpack("<4sI4s", header)
+        if riff != b"RIFF" or wave_id != b"WAVE":
+            return None
+
+        byte_rate = None
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                return None
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                # fmt: format, channels, sample rate, byte rate, ...
+                fmt = f.read(12)
+                if len(fmt) < 12:
+                    return None
+                byte_rate = struct.unpack("<HHII", fmt)[3]
+                f.seek(chunk_size - 12 + (chunk_size & 1), os.SEEK_CUR)
+            elif chunk_id == b"data":
+                if not byte_rate or chunk_size in (0, 0xFFFFFFFF):
+                    return None
+                return chunk_size / byte_rate
+            else:
+                # Chunks are word-aligned
+                f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_duration(audio_file: str, size: int, mtime_ns: int) -> float:
+    """
+    Duration of audio_file in seconds, probing with FFprobe on a cache miss.
+
+    size and mtime_ns are part of the key so a modified file is re-probed.
+    """
+    cache_file = _DURATION_CACHE_DIR / f"{hashlib.sha1(audio_file.encode()).hexdigest()}.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+        if cached["size"] == size and cached["mtime_ns"] == mtime_ns:
+            return cached["duration"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    cmd = [
+        "ffprobe",
+        "-v", "error",
+        "-show_entries", "format=duration",
+        "-of", "default=noprint_wrappers=1:nokey=1",
+        audio_file
+    ]
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=10
+    )
+    duration = float(result.stdout.strip())
+
+    try:
+        _DURATION_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"size": size, "mtime_ns": mtime_ns, "duration": duration}))
+    except OSError as e:
+        logger.debug(f"Could not write duration cache: {e}")
+
+    return duration
+
+
+async def _extract_one_chunk(
+    semaphore: asyncio.Semaphore,
+    input_file: str,
+    start: float,
+    duration: float,
+    chunk_file: str,
+    codec_args: List[str],
+    timeout: float,
+    threads_args: List[str],
+) -> str:
+    """
+    Extract one chunk with FFmpeg.
+
+    Args:
+        semaphore: Bounds how many FFmpeg processes run at once
+        input_file: Input audio file
+        start: Chunk start in seconds
+        duration: Chunk duration in seconds
+        chunk_file: Output chunk path
+        codec_args: FFmpeg codec arguments
+        timeout: FFmpeg timeout in seconds
+        threads_args: FFmpeg -threads option, from _ffmpeg_threads()
+
+    Returns:
+        chunk_file
+
+    Raises:
+        RuntimeError: If FFmpeg fails or times out
+    """
+    # -ss before -i seeks in the container instead of decoding up to start
+    # (still sample-accurate when re-encoding: -accurate_seek is the default)
+    cmd = [
+        "ffmpeg",
+        *_FFMPEG_QUIET,
+        *threads_args,
+        "-ss", str(start),
+        "-i", input_file,
+        "-t", str(duration),
+        *codec_args,
+        *threads_args,
+        "-y",  # Overwrite
+        chunk_file
+    ]
+
+    async with semaphore:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise RuntimeError(f"Timeout creating chunk {Path(chunk_file).name}")
+        except asyncio.CancelledError:
+            # Another chunk failed; don't leave this FFmpeg running
+            proc.kill()
+            await proc.wait()
+            raise
+
+    if proc.returncode != 0:
+        logger.error(f"FFmpeg error for {Path(chunk_file).name}: {stderr.decode(errors='replace')}")
+        raise RuntimeError(f"Failed to create chunk {Path(chunk_file).name}")
+
+    logger.info(f"✓ {Path(chunk_file).name}: {start:.1f}s - {start + duration:.1f}s ({duration:.1f}s)")
+    return chunk_file
+
+
+def _read_wav_stream_header(stream) -> Tuple[int, int, int]:
+    """
+    Parse the RIFF header of a WAV stream, leaving it positioned at the PCM data.
+
+    FFmpeg can't seek back into a pipe to fill in the RIFF and data sizes,
+    so they are ignored and the data is assumed to run until EOF.
+
+    Args:
+        stream: Binary file object positioned at the start of the WAV
+
+    Returns:
+        Tuple of (channels, sample rate, sample width in bytes)
+
+    Raises:
+        RuntimeError: If the stream is not 16-bit PCM WAV
+    """
+    header = stream.read(12)
+    if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+        raise RuntimeError("FFmpeg output is not a WAV stream")
+
+    fmt = None
+    while True:
+        chunk_header = stream.read(8)
+        if len(chunk_header) < 8:
+            raise RuntimeError("WAV stream ended before its data chunk")
+        chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+        if chunk_id == b"data":
+            break
+        body = stream.read(chunk_size + (chunk_size & 1))  # Chunks are word-aligned
+        if chunk_id == b"fmt ":
+            fmt = body
+
+    if fmt is None or len(fmt) < 16:
+        raise RuntimeError("WAV stream has no fmt chunk")
+    audio_format, channels, sample_rate, _, _, bits = struct.unpack("<HHIIHH", fmt[:16])
+    if audio_format not in (1, 0xFFFE) or bits != 16:
+        raise RuntimeError(f"unexpected WAV stream format {audio_format}/{bits}-bit")
+    return channels, sample_rate, bits // 8
+
+
+# Integer millisecond metadata fields -> float-seconds field they replace
+_MS_FIELDS = {
+    "start_ms": "start_time",
+    "end_ms": "end_time",
+    "core_start_ms": "core_start",
+    "core_end_ms": "core_end",
+    "core_duration_ms": "core_duration",
+}
+
+
+def _ndjson_line(obj: Dict[str, Any]) -> bytes:
+    """Serialize obj as one NDJSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return (json.dumps(obj, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+def _to_soa(chunks_metadata: List[Dict]) -> Dict[str, Any]:
+    """
+    Convert a list of chunk metadata dicts into one numpy array per field.
+
+    Args:
+        chunks_metadata: List of chunk metadata from process()
+
+    Returns:
+        Dict mapping chunk_number, start_ms, end_ms, core_start_ms,
+        core_end_ms and core_duration_ms to 1-D int64 numpy arrays
+    """
+    import numpy as np
+
+    n = len(chunks_metadata)
+    soa = {}
+    for field, seconds_field in _MS_FIELDS.items():
+        if n and field not in chunks_metadata[0]:
+            # Metadata saved before the *_ms fields existed
+            values = (round(c[seconds_field] * 1000) for c in chunks_metadata)
+        else:
+            values = (c[field] for c in chunks_metadata)
+        soa[field] = np.fromiter(values, dtype=np.int64, count=n)
+    soa["chunk_number"] = np.fromiter(
+        (c["chunk_number"] for c in chunks_metadata), dtype=np.int64, count=n
+    )
+    return soa
+
 
 class SmartChunker:
     """
@@ -69,24 +371,12 @@ class SmartChunker:
         self.total_chunk_duration = chunk_duration + (2 * overlap_duration)
 
         # Check FFmpeg availability
-        self._check_ffmpeg()
-
-    def _check_ffmpeg(self) -> None:
-        """Verify FFmpeg is installed."""
-        try:
-            subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                timeout=5
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                "FFmpeg not found. Install with: brew install ffmpeg"
-            )
+        _verify_ffmpeg()
 
     def _get_audio_duration(self, audio_file: str) -> float:
         """
-        Get audio duration using FFprobe.
+        Get audio duration from the WAV header, or FFprobe (cached per file
+        size and mtime) for other formats.
 
         Args:
             audio_file: Path to audio file
@@ -95,20 +385,13 @@ class SmartChunker:
             Duration in seconds
         """
         try:
-            cmd = [
-                "ffprobe",
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                audio_file
-            ]
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            return float(result.stdout.strip())
+            if Path(audio_file).suffix.lower() in ('.wav', '.wave'):
+                duration = _wav_duration(audio_file)
+                if duration is not None:
+                    return duration
+
+            st = os.stat(audio_file)
+            return _cached_duration(os.path.abspath(audio_file), st.st_size, st.st_mtime_ns)
         except Exception as e:
             logger.error(f"Could not get duration: {e}")
             raise
@@ -118,6 +401,7 @@ class SmartChunker:
         input_file: str,
         output_dir: str,
         save_metadata: bool = True,
+        pretty: bool = False,
     ) -> Dict[str, Any]:
         """
         Split audio into smart overlapping chunks.
@@ -126,6 +410,7 @@ class SmartChunker:
             input_file: Path to input audio file
             output_dir: Directory for output chunks
             save_metadata: Whether to save chunk metadata to JSON
+            pretty: Indent the metadata JSON (compact by default)
 
         Returns:
             Dict containing:
@@ -147,16 +432,12 @@ class SmartChunker:
         output_path.mkdir(parents=True, exist_ok=True)
 
         logger.info(f"Chunking audio: {input_file}")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         # Get total duration
         total_duration = self._get_audio_duration(str(input_path))
         logger.info(f"Audio duration: {total_duration:.2f}s ({total_duration/60:.1f} min)")
 
-        # Calculate chunks
-        chunks_metadata = []
-        chunk_files = []
-
         # Calculate number of chunks needed
         # Each chunk moves forward by chunk_duration (not total_chunk_duration)
         num_chunks = math.ceil(total_duration / self.chunk_duration)
@@ -166,94 +447,635 @@ class SmartChunker:
             f"({self.chunk_duration}s core + {self.overlap_duration}s overlap each side)"
         )
 
-        for i in range(num_chunks):
-            chunk_num = i + 1
+        # Determine output format based on input
+        input_suffix = input_path.suffix.lower()
+        if input_suffix in ['.wav', '.wave']:
+            # Keep WAV format for WAV input
+            chunk_ext = ".wav"
+            codec_args = ["-c", "copy"]  # Copy WAV codec
+        elif input_suffix in _STREAM_COPY_SUFFIXES:
+            # Compressed audio is cut at packet boundaries, no re-encode
+            chunk_ext = input_suffix
+            codec_args = ["-c", "copy", "-avoid_negative_ts", "make_zero"]
+        else:
+            # Convert to MP3 for other formats
+            chunk_ext = ".mp3"
+            codec_args = ["-c:a", "libmp3lame", "-b:a", "128k"]  # Encode to MP3
+
+        chunk_files = None
+        chunk_sizes = None  # Known sizes skip a stat() per chunk
+        if av is not None and codec_args[:2] == ["-c", "copy"]:
+            # Packet copy needs no decode: remux in-process, no FFmpeg at all
+            try:
+                chunk_files = self._remux_chunks_pyav(
+                    input_path, output_path, total_duration, num_chunks, chunk_ext
+                )
+            except (av.error.FFmpegError, ValueError, IndexError) as e:
+                logger.warning(f"In-process remux failed ({e}), falling back to FFmpeg")
+
+        if chunk_files is not None:
+            pass  # Remuxed in-process
+        elif self.overlap_duration == 0:
+            # Back-to-back chunks: one FFmpeg pass splits the whole file
+            chunk_files = self._split_single_pass(input_path, output_path, chunk_ext, codec_args)
+        elif num_chunks > 1 and self.chunk_duration > 2 * self.overlap_duration:
+            # One decode pass, streamed and cut into overlapping chunks in Python
+            try:
+                chunk_files, chunk_sizes = self._split_overlapped_single_pass(
+                    input_path, output_path, total_duration, num_chunks
+                )
+            except (RuntimeError, wave.Error) as e:
+                logger.warning(f"Single-pass chunking failed ({e}), extracting chunks one by one")
 
-            # Calculate timing
-            start = max(0, i * self.chunk_duration - self.overlap_duration)
-            end = min(
-                total_duration,
-                (i + 1) * self.chunk_duration + self.overlap_duration
+        if chunk_files is None:
+            chunk_files = self._split_per_chunk(
+                input_path, output_path, total_duration, num_chunks, chunk_ext, codec_args
             )
-            duration = end - start
 
-            # Core segment (without overlap)
-            core_start = i * self.chunk_duration
-            core_end = min(total_duration, (i + 1) * self.chunk_duration)
+        chunks_metadata = []
+        table = self._chunk_table(len(chunk_files), total_duration)
+        with self._open_chunk_index(output_path, save_metadata) as index:
+            for i, chunk_file in enumerate(chunk_files):
+                chunk_meta = self._chunk_metadata(
+                    i, total_duration, Path(chunk_file), table[i],
+                    chunk_sizes[i] if chunk_sizes else None,
+                )
+                chunks_metadata.append(chunk_meta)
+                if index is not None:
+                    index.write(_ndjson_line(chunk_meta))
 
-            # Overlap information
-            has_left_overlap = i > 0
-            has_right_overlap = (i + 1) * self.chunk_duration < total_duration
+        return self._finish(
+            input_path, output_path, total_duration, chunks_metadata, chunk_files,
+            start_time, save_metadata, pretty,
+        )
 
-            # Determine output format based on input
-            input_suffix = input_path.suffix.lower()
-            if input_suffix in ['.wav', '.wave']:
-                # Keep WAV format for WAV input
-                chunk_file = output_path / f"chunk_{chunk_num:03d}.wav"
-                codec_args = ["-c", "copy"]  # Copy WAV codec
-            else:
-                # Convert to MP3 for other formats
-                chunk_file = output_path / f"chunk_{chunk_num:03d}.mp3"
-                codec_args = ["-c:a", "libmp3lame", "-b:a", "128k"]  # Encode to MP3
-
-            # Extract chunk with FFmpeg
-            cmd = [
-                "ffmpeg",
-                "-i", str(input_path),
-                "-ss", str(start),
-                "-t", str(duration),
-                *codec_args,
-                "-y",  # Overwrite
-                str(chunk_file)
-            ]
+    async def process_async(
+        self,
+        input_file: str,
+        output_dir: str,
+        save_metadata: bool = True,
+        pretty: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Async version of process() for callers running an event loop.
+
+        Chunking runs in a worker thread with its own event loop for the
+        FFmpeg subprocesses, so the caller's loop is never blocked.
+
+        Args:
+            Same as process()
+
+        Returns:
+            Same dictionary as process()
+        """
+        return await asyncio.to_thread(
+            self.process, input_file, output_dir, save_metadata, pretty
+        )
+
+    def _split_single_pass(
+        self,
+        input_path: Path,
+        output_path: Path,
+        chunk_ext: str,
+        codec_args: List[str],
+    ) -> List[str]:
+        """
+        Split audio into back-to-back chunks with one FFmpeg segment-muxer run.
+
+        Args:
+            input_path: Input audio file
+            output_path: Directory for output chunks
+            chunk_ext: Chunk file extension (".wav" or ".mp3")
+            codec_args: FFmpeg codec arguments for the chunks
+
+        Returns:
+            List of chunk file paths, in order
+        """
+        # Chunks left from an earlier run in this directory are not ours
+        for stale in output_path.glob("chunk_*"):
+            if stale.is_file():
+                stale.unlink()
 
+        # The muxer lists each segment it finishes, in order
+        segment_list = output_path / "segments.list"
+
+        threads_args = _ffmpeg_threads()
+        cmd = [
+            "ffmpeg",
+            *_FFMPEG_QUIET,
+            *threads_args,
+            "-i", str(input_path),
+            "-map", "0:a",
+            *codec_args,
+            *threads_args,
+            "-f", "segment",
+            "-segment_time", str(self.chunk_duration),
+            "-segment_start_number", "1",
+            "-segment_list", str(segment_list),
+            "-segment_list_type", "flat",
+            "-reset_timestamps", "1",
+            "-y",  # Overwrite
+            str(output_path / f"chunk_%03d{chunk_ext}")
+        ]
+
+        try:
             try:
                 result = subprocess.run(
                     cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    timeout=3600
                 )
+            except subprocess.TimeoutExpired:
+                raise RuntimeError("Timeout splitting audio into chunks")
 
-                if result.returncode != 0:
-                    logger.error(f"FFmpeg error for chunk {chunk_num}: {result.stderr}")
-                    raise RuntimeError(f"Failed to create chunk {chunk_num}")
-
-                # Metadata for this chunk
-                chunk_meta = {
-                    "chunk_number": chunk_num,
-                    "file": str(chunk_file),
-                    "filename": chunk_file.name,
-                    "start_time": round(start, 2),
-                    "end_time": round(end, 2),
-                    "duration": round(duration, 2),
-                    "core_start": round(core_start, 2),
-                    "core_end": round(core_end, 2),
-                    "core_duration": round(core_end - core_start, 2),
-                    "overlap": {
-                        "left": self.overlap_duration if has_left_overlap else 0,
-                        "right": self.overlap_duration if has_right_overlap else 0,
-                    },
-                    "size_bytes": chunk_file.stat().st_size,
-                }
+            if result.returncode != 0:
+                logger.error(f"FFmpeg segment error: {result.stderr.decode(errors='replace')}")
+                raise RuntimeError("Failed to split audio into chunks")
+
+            with open(segment_list, encoding="utf-8") as f:
+                # Entries are file names relative to the output directory
+                chunk_files = [str(output_path / name) for name in f.read().splitlines() if name]
+        finally:
+            segment_list.unlink(missing_ok=True)
+        logger.info(f"✓ Split into {len(chunk_files)} chunks in a single pass")
+        return chunk_files
+
+    def _split_overlapped_single_pass(
+        self,
+        input_path: Path,
+        output_path: Path,
+        total_duration: float,
+        num_chunks: int,
+    ) -> Tuple[List[str], List[int]]:
+        """
+        Build overlapping WAV chunks from a single FFmpeg decode pass.
+
+        FFmpeg decodes the whole input once and streams it as WAV to stdout.
+        The PCM data is cut into overlapping chunks in Python as it arrives,
+        keeping at most one chunk (plus one read block) in memory and
+        writing nothing but the chunks themselves to disk.
+
+        Args:
+            input_path: Input audio file
+            output_path: Directory for output chunks
+            total_duration: Input duration in seconds
+            num_chunks: Number of chunks to create
 
+        Returns:
+            Tuple of (chunk file paths, chunk sizes in bytes), in order
+
+        Raises:
+            RuntimeError: If FFmpeg fails, times out or its output can't be parsed
+        """
+        threads_args = _ffmpeg_threads()
+        cmd = [
+            "ffmpeg",
+            *_FFMPEG_QUIET,
+            *threads_args,
+            "-i", str(input_path),
+            "-map", "0:a",
+            "-c:a", "pcm_s16le",
+            "-f", "wav",
+            "pipe:1"
+        ]
+
+        deadline = time.monotonic() + 3600
+        with tempfile.TemporaryFile() as stderr_file:
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr_file)
+            try:
+                chunk_files, chunk_sizes = self._cut_wav_stream(
+                    proc.stdout, output_path, total_duration, num_chunks, deadline
+                )
+                proc.wait(timeout=max(1.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                raise RuntimeError("timeout decoding audio")
+            finally:
+                if proc.poll() is None:
+                    proc.kill()
+                    proc.wait()
+                proc.stdout.close()
+
+            if proc.returncode != 0:
+                stderr_file.seek(0)
+                logger.error(f"FFmpeg decode error: {stderr_file.read().decode(errors='replace')}")
+                raise RuntimeError("FFmpeg could not decode audio")
+
+        logger.info(f"✓ Cut {len(chunk_files)} overlapping chunks from a single decode pass")
+        return chunk_files, chunk_sizes
+
+    def _cut_wav_stream(
+        self,
+        stream,
+        output_path: Path,
+        total_duration: float,
+        num_chunks: int,
+        deadline: float,
+    ) -> Tuple[List[str], List[int]]:
+        """
+        Cut a streamed WAV (RIFF header + PCM data until EOF) into chunks.
+
+        Args:
+            stream: Binary file object FFmpeg writes the WAV to
+            output_path: Directory for output chunks
+            total_duration: Input duration in seconds
+            num_chunks: Number of chunks to create
+            deadline: time.monotonic() value after which decoding is aborted
+
+        Returns:
+            Tuple of (chunk file paths, chunk sizes in bytes), in order; fewer
+            than num_chunks if the stream is shorter than total_duration
+
+        Raises:
+            RuntimeError: If decoding times out or the stream has no audio
+        """
+        channels, sample_rate, sampwidth = _read_wav_stream_header(stream)
+        frame_size = channels * sampwidth
+
+        chunk_files = []
+        chunk_sizes = []
+        buf = bytearray()
+        buf_start = 0  # Frame offset of buf[0] in the stream
+        eof = False
+
+        for i in range(num_chunks):
+            start, end = self._chunk_bounds(i, total_duration)
+            first = round(start * sample_rate)
+            last = round(end * sample_rate)
+
+            # Read until the chunk's last frame is buffered (the real stream
+            # may be a little shorter than the probed duration)
+            while not eof and buf_start + len(buf) // frame_size < last:
+                if time.monotonic() > deadline:
+                    raise RuntimeError("timeout decoding audio")
+                block = stream.read(_PIPE_READ_SIZE)
+                if block:
+                    buf += block
+                else:
+                    eof = True
+
+            available = buf_start + len(buf) // frame_size
+            if first >= available:
+                # The stream ended before this chunk starts
+                logger.warning(
+                    f"Decoded audio ended at {available / sample_rate:.1f}s, before the probed "
+                    f"{total_duration:.1f}s; keeping {i} of {num_chunks} chunks"
+                )
+                break
+            data = buf[(first - buf_start) * frame_size:(min(last, available) - buf_start) * frame_size]
+
+            chunk_file = output_path / f"chunk_{i + 1:03d}.wav"
+            with wave.open(str(chunk_file), "wb") as dst:
+                dst.setnchannels(channels)
+                dst.setsampwidth(sampwidth)
+                dst.setframerate(sample_rate)
+                dst.writeframes(data)
+
+            chunk_files.append(str(chunk_file))
+            chunk_sizes.append(44 + len(data))  # 44-byte PCM header + sample data
+
+            # Drop frames no later chunk needs
+            if i + 1 < num_chunks:
+                next_first = round(self._chunk_bounds(i + 1, total_duration)[0] * sample_rate)
+                drop = max(0, min(next_first, available) - buf_start)
+                del buf[:drop * frame_size]
+                buf_start += drop
+
+        # Read the rest of the stream: the decode can run past the probed
+        # duration, and FFmpeg would block on a full pipe before exiting
+        while not eof:
+            if time.monotonic() > deadline:
+                raise RuntimeError("timeout decoding audio")
+            eof = not stream.read(_PIPE_READ_SIZE)
+
+        if not chunk_files:
+            raise RuntimeError("FFmpeg produced no audio")
+        return chunk_files, chunk_sizes
+
+    def _remux_chunks_pyav(
+        self,
+        input_path: Path,
+        output_path: Path,
+        total_duration: float,
+        num_chunks: int,
+        chunk_ext: str,
+    ) -> List[str]:
+        """
+        Cut overlapping chunks by copying packets with PyAV, in-process.
+
+        The input is demuxed once; every packet is copied into each chunk
+        whose time range contains it (at most two at a time, where chunks
+        overlap). Like FFmpeg's -c copy, cuts land on packet boundaries.
+
+        Args:
+            input_path: Input audio file
+            output_path: Directory for output chunks
+            total_duration: Input duration in seconds
+            num_chunks: Number of chunks to create
+            chunk_ext: Chunk file extension (same container as the input)
+
+        Returns:
+            List of chunk file paths, in order
+        """
+        bounds = [self._chunk_bounds(i, total_duration) for i in range(num_chunks)]
+        chunk_files = [
+            str(output_path / f"chunk_{i + 1:03d}{chunk_ext}") for i in range(num_chunks)
+        ]
+
+        open_chunks = {}  # chunk index -> (output container, output stream, first pts)
+        next_chunk = 0
+        with av.open(str(input_path)) as container:
+            stream = container.streams.audio[0]
+            time_base = stream.time_base
+            try:
+                for packet in container.demux(stream):
+                    if packet.pts is None:  # Flush packet at end of stream
+                        continue
+                    t = float(packet.pts * time_base)
+
+                    while next_chunk < num_chunks and bounds[next_chunk][0] <= t:
+                        out = av.open(chunk_files[next_chunk], "w")
+                        add_stream = getattr(out, "add_stream_from_template", None)
+                        out_stream = add_stream(stream) if add_stream else out.add_stream(template=stream)
+                        open_chunks[next_chunk] = (out, out_stream, packet.pts)
+                        next_chunk += 1
+
+                    for i in list(open_chunks):
+                        out, out_stream, first_pts = open_chunks[i]
+                        if t >= bounds[i][1]:
+                            out.close()
+                            del open_chunks[i]
+                            continue
+                        # Timestamps restart at 0 in every chunk
+                        copy = av.Packet(bytes(packet))
+                        copy.pts = packet.pts - first_pts
+                        copy.dts = packet.dts - first_pts if packet.dts is not None else None
+                        copy.duration = packet.duration
+                        copy.time_base = time_base
+                        copy.stream = out_stream
+                        out.mux(copy)
+            finally:
+                for out, _, _ in open_chunks.values():
+                    out.close()
+
+        # Chunks starting past the real end of the stream were never opened
+        chunk_files = chunk_files[:next_chunk]
+        logger.info(f"✓ Remuxed {len(chunk_files)} chunks in-process from a single demux pass")
+        return chunk_files
+
+    def _split_per_chunk(
+        self,
+        input_path: Path,
+        output_path: Path,
+        total_duration: float,
+        num_chunks: int,
+        chunk_ext: str,
+        codec_args: List[str],
+    ) -> List[str]:
+        """
+        Extract overlapping chunks with one FFmpeg run per chunk.
+
+        Chunks are extracted concurrently as asyncio subprocesses, up to
+        half the CPU cores at once.
+
+        Args:
+            input_path: Input audio file
+            output_path: Directory for output chunks
+            total_duration: Input duration in seconds
+            num_chunks: Number of chunks to extract
+            chunk_ext: Chunk file extension (".wav" or ".mp3")
+            codec_args: FFmpeg codec arguments for the chunks
+
+        Returns:
+            List of chunk file paths, in order
+        """
+        workers = max(1, min(num_chunks, (os.cpu_count() or 2) // 2))
+
+        input_str = str(input_path)
+        output_str = str(output_path)
+        threads_args = _ffmpeg_threads(concurrent=workers > 1)
+
+        async def extract_all() -> List[str]:
+            semaphore = asyncio.Semaphore(workers)
+            tasks = []
+            for i in range(num_chunks):
+                start, end = self._chunk_bounds(i, total_duration)
+                chunk_file = f"{output_str}/chunk_{i + 1:03d}{chunk_ext}"
+                tasks.append(asyncio.ensure_future(_extract_one_chunk(
+                    semaphore, input_str, start, end - start, chunk_file, codec_args, 60,
+                    threads_args,
+                )))
+            try:
+                return list(await asyncio.gather(*tasks))
+            finally:
+                # On failure, stop the chunks still queued or running
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        chunk_files = asyncio.run(extract_all())
+
+        logger.info(f"✓ Extracted {num_chunks} chunks with {workers} parallel FFmpeg processes")
+        return chunk_files
+
+    def process_samples(
+        self,
+        samples,
+        sample_rate: int,
+        output_dir: str,
+        save_metadata: bool = True,
+        input_file: Optional[str] = None,
+        pretty: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Split in-memory mono samples into smart overlapping WAV chunks.
+
+        Same chunk layout and metadata as process(), but chunks are sliced
+        from the array and written directly, without an intermediate file
+        or one FFmpeg run per chunk.
+
+        Args:
+            samples: 1-D numpy array of mono samples (int16, or float in [-1, 1])
+            sample_rate: Sample rate of samples
+            output_dir: Directory for output chunks
+            save_metadata: Whether to save chunk metadata to JSON
+            input_file: Original file the samples came from (for metadata)
+            pretty: Indent the metadata JSON (compact by default)
+
+        Returns:
+            Same dictionary as process()
+        """
+        import numpy as np
+
+        if samples.dtype != np.int16:
+            samples = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16)
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        logger.info(f"Chunking audio from memory: {input_file or '<buffer>'}")
+        start_time = time.perf_counter()
+
+        total_duration = len(samples) / sample_rate
+        logger.info(f"Audio duration: {total_duration:.2f}s ({total_duration/60:.1f} min)")
+
+        chunks_metadata = []
+        chunk_files = []
+        num_chunks = math.ceil(total_duration / self.chunk_duration)
+
+        logger.info(
+            f"Creating {num_chunks} chunks "
+            f"({self.chunk_duration}s core + {self.overlap_duration}s overlap each side)"
+        )
+
+        table = self._chunk_table(num_chunks, total_duration)
+        with self._open_chunk_index(output_path, save_metadata) as index:
+            for i in range(num_chunks):
+                chunk_num = i + 1
+                start, end = self._chunk_bounds(i, total_duration)
+                chunk_file = output_path / f"chunk_{chunk_num:03d}.wav"
+
+                data = samples[round(start * sample_rate):round(end * sample_rate)].tobytes()
+                with wave.open(str(chunk_file), "wb") as wav:
+                    wav.setnchannels(1)
+                    wav.setsampwidth(2)
+                    wav.setframerate(sample_rate)
+                    wav.writeframes(data)
+
+                # 44-byte PCM header + sample data
+                chunk_meta = self._chunk_metadata(
+                    i, total_duration, chunk_file, table[i], 44 + len(data)
+                )
                 chunks_metadata.append(chunk_meta)
+                if index is not None:
+                    index.write(_ndjson_line(chunk_meta))
                 chunk_files.append(str(chunk_file))
 
                 logger.info(
                     f"✓ Chunk {chunk_num}/{num_chunks}: "
-                    f"{start:.1f}s - {end:.1f}s ({duration:.1f}s)"
+                    f"{start:.1f}s - {end:.1f}s ({end - start:.1f}s)"
                 )
 
-            except subprocess.TimeoutExpired:
-                raise RuntimeError(f"Timeout creating chunk {chunk_num}")
-            except Exception as e:
-                logger.error(f"Error creating chunk {chunk_num}: {e}")
-                raise
+        return self._finish(
+            Path(input_file or "<buffer>"), output_path, total_duration,
+            chunks_metadata, chunk_files, start_time, save_metadata, pretty,
+        )
+
+    def _open_chunk_index(self, output_path: Path, save_metadata: bool):
+        """
+        Open the chunks.ndjson sidecar that chunk metadata is appended to as
+        chunks are produced, one JSON object per line.
+
+        The sidecar is readable while a job is still running (and after a
+        crash), unlike chunking_metadata.json which is written at the end.
+        Yields None when metadata is not being saved.
+        """
+        if not save_metadata:
+            return contextlib.nullcontext()
+        return open(output_path / "chunks.ndjson", "wb")
+
+    def _chunk_bounds(self, index: int, total_duration: float) -> Tuple[float, float]:
+        """Start and end time (with overlap) of chunk `index` (0-based)."""
+        start = max(0, index * self.chunk_duration - self.overlap_duration)
+        end = min(
+            total_duration,
+            (index + 1) * self.chunk_duration + self.overlap_duration
+        )
+        return start, end
+
+    def _chunk_table(self, num_chunks: int, total_duration: float) -> List[Tuple[int, ...]]:
+        """
+        Timing of every chunk in integer milliseconds, computed for all chunks at once.
+
+        Returns:
+            One (start, end, duration, core_start, core_end, core_duration)
+            tuple of ints (ms) per chunk
+        """
+        import numpy as np
+
+        index = np.arange(num_chunks, dtype=np.int64)
+        chunk_ms = round(self.chunk_duration * 1000)
+        overlap_ms = round(self.overlap_duration * 1000)
+        total_ms = round(total_duration * 1000)
+
+        starts = np.maximum(0, index * chunk_ms - overlap_ms)
+        ends = np.minimum(total_ms, (index + 1) * chunk_ms + overlap_ms)
+
+        # Core segment (without overlap)
+        core_starts = index * chunk_ms
+        core_ends = np.minimum(total_ms, (index + 1) * chunk_ms)
+
+        # Durations are exact: integer differences, no rounding needed
+        table = np.stack(
+            [starts, ends, ends - starts, core_starts, core_ends, core_ends - core_starts], axis=1
+        )
+        return [tuple(row) for row in table.tolist()]
+
+    def _chunk_metadata(
+        self,
+        index: int,
+        total_duration: float,
+        chunk_file: Path,
+        timing: Tuple[float, ...],
+        size_bytes: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Metadata entry for chunk `index` (0-based) written to chunk_file.
+
+        timing is the chunk's row from _chunk_table() (integer ms). size_bytes is the file
+        size when the caller already knows it; the file is only stat()ed
+        otherwise.
+        """
+        start, end, duration, core_start, core_end, core_duration = timing
+
+        # Overlap information
+        has_left_overlap = index > 0
+        has_right_overlap = (index + 1) * self.chunk_duration < total_duration
+
+        return {
+            "chunk_number": index + 1,
+            "file": str(chunk_file),
+            "filename": chunk_file.name,
+            "start_ms": start,
+            "end_ms": end,
+            "duration_ms": duration,
+            "core_start_ms": core_start,
+            "core_end_ms": core_end,
+            "core_duration_ms": core_duration,
+            # Float seconds, kept for existing readers (e.g. SRT offsets)
+            "start_time": start / 1000,
+            "end_time": end / 1000,
+            "duration": duration / 1000,
+            "core_start": core_start / 1000,
+            "core_end": core_end / 1000,
+            "core_duration": core_duration / 1000,
+            "overlap": {
+                "left": self.overlap_duration if has_left_overlap else 0,
+                "right": self.overlap_duration if has_right_overlap else 0,
+            },
+            "size_bytes": size_bytes if size_bytes is not None else chunk_file.stat().st_size,
+        }
+
+    def _finish(
+        self,
+        input_path: Path,
+        output_path: Path,
+        total_duration: float,
+        chunks_metadata: List[Dict],
+        chunk_files: List[str],
+        start_time: float,
+        save_metadata: bool,
+        pretty: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Build (and optionally save) the chunking metadata for a finished run.
+
+        start_time is the time.perf_counter() value taken when the run began.
+        """
+        num_chunks = len(chunks_metadata)
 
         # Calculate statistics
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = time.perf_counter() - start_time
         speed_factor = total_duration / processing_time if processing_time > 0 else 0
 
         # Total size of all chunks
@@ -279,8 +1101,13 @@ class SmartChunker:
         # Save metadata
         if save_metadata:
             metadata_file = output_path / "chunking_metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2 if pretty else 0)
+            else:
+                payload = json.dumps(
+                    metadata, indent=2 if pretty else None, ensure_ascii=False
+                ).encode('utf-8')
+            metadata_file.write_bytes(payload)
             metadata["metadata_file"] = str(metadata_file)
             logger.info(f"Metadata saved to: {metadata_file}")
 
@@ -301,40 +1128,47 @@ class SmartChunker:
         Returns:
             List of merge instructions with overlap regions
         """
-        merge_info = []
+        soa = _to_soa(chunks_metadata)
+        numbers = soa["chunk_number"].tolist()
+        core_starts = (soa["core_start_ms"] / 1000).tolist()
+        core_ends = (soa["core_end_ms"] / 1000).tolist()
+        core_durations = (soa["core_duration_ms"] / 1000).tolist()
+        starts = (soa["start_ms"] / 1000).tolist()
+        ends = (soa["end_ms"] / 1000).tolist()
 
-        for i, chunk in enumerate(chunks_metadata):
+        # Left overlap of chunk i is [start_i, core_start_i]; right overlap
+        # is [core_end_i, end_i]. Exact integer ms differences, for all chunks at once.
+        left_durations = ((soa["core_start_ms"] - soa["start_ms"]) / 1000).tolist()
+        right_durations = ((soa["end_ms"] - soa["core_end_ms"]) / 1000).tolist()
+
+        merge_info = []
+        last = len(numbers) - 1
+        for i, number in enumerate(numbers):
             info = {
-                "chunk_number": chunk["chunk_number"],
+                "chunk_number": number,
                 "core_region": {
-                    "start": chunk["core_start"],
-                    "end": chunk["core_end"],
-                    "duration": chunk["core_duration"],
+                    "start": core_starts[i],
+                    "end": core_ends[i],
+                    "duration": core_durations[i],
                 },
             }
 
             # Overlap with previous chunk
             if i > 0:
-                prev_chunk = chunks_metadata[i - 1]
-                overlap_start = chunk["start_time"]
-                overlap_end = chunk["core_start"]
                 info["left_overlap"] = {
-                    "start": overlap_start,
-                    "end": overlap_end,
-                    "duration": overlap_end - overlap_start,
-                    "overlaps_with_chunk": prev_chunk["chunk_number"],
+                    "start": starts[i],
+                    "end": core_starts[i],
+                    "duration": left_durations[i],
+                    "overlaps_with_chunk": numbers[i - 1],
                 }
 
             # Overlap with next chunk
-            if i < len(chunks_metadata) - 1:
-                next_chunk = chunks_metadata[i + 1]
-                overlap_start = chunk["core_end"]
-                overlap_end = chunk["end_time"]
+            if i < last:
                 info["right_overlap"] = {
-                    "start": overlap_start,
-                    "end": overlap_end,
-                    "duration": overlap_end - overlap_start,
-                    "overlaps_with_chunk": next_chunk["chunk_number"],
+                    "start": core_ends[i],
+                    "end": ends[i],
+                    "duration": right_durations[i],
+                    "overlaps_with_chunk": numbers[i + 1],
                 }
 
             merge_info.append(info)
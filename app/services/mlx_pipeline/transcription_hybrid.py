@@ -6,7 +6,7 @@ Apple Silicon (M1/M2/M3/M4) Macs.
 
 Features:
 - MLX GPU acceleration (15-50x faster than CPU)
-- ThreadPool with shared model (memory efficient)
+- ThreadPool feeding a single MLX inference thread (one shared model)
 - Smart overlap detection and merging
 - Progress tracking with checkpoints
 - Multiple output formats (TXT, JSON, SRT, VTT)
@@ -26,17 +26,200 @@ Models supported:
 
 import json
 import logging
+import logging.handlers
+import os
+import subprocess
+import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from datetime import datetime, timedelta
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
 import re
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
+import queue
 import gc
 import multiprocessing
+import multiprocessing.util
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is the fallback
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# How long the MLX thread waits for more requests to join a batch (seconds)
+_BATCH_WAIT = 0.05
+
+# mlx_whisper.transcribe() defaults, used by the in-process decode path
+_TEMPERATURES = (0.0, 0.2, 0.4, 0.6, 0.8, 1.0)
+_COMPRESSION_RATIO_THRESHOLD = 2.4
+_LOGPROB_THRESHOLD = -1.0
+_NO_SPEECH_THRESHOLD = 0.6
+
+# Chunk formats SmartChunker can produce (WAV, MP3, or stream-copied input)
+CHUNK_SUFFIXES = (".wav", ".mp3", ".m4a", ".aac", ".ogg", ".opus")
+
+# Whisper's input sample rate
+_SAMPLE_RATE = 16000
+
+# Formats libsndfile reads in-process (no FFmpeg spawn)
+_SOUNDFILE_SUFFIXES = (".wav", ".flac", ".ogg")
+
+
+def _read_soundfile(audio_file: str):
+    """
+    Read an audio file in-process with soundfile, resampled to 16 kHz mono.
+
+    Returns:
+        1-D numpy float32 array, or None if soundfile can't read the file
+    """
+    try:
+        import soundfile as sf
+    except ImportError:
+        return None
+
+    import numpy as np
+
+    try:
+        audio, sample_rate = sf.read(audio_file, dtype="float32", always_2d=False)
+    except Exception:
+        return None  # Unsupported codec (e.g. Opus in OGG on old libsndfile)
+
+    if audio.ndim > 1:
+        audio = audio.mean(axis=1)
+    if sample_rate != _SAMPLE_RATE:
+        from math import gcd
+        from scipy.signal import resample_poly
+
+        g = gcd(sample_rate, _SAMPLE_RATE)
+        audio = resample_poly(audio, _SAMPLE_RATE // g, sample_rate // g)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def _load_audio(audio_file: str):
+    """
+    Decode an audio file to 16 kHz mono float32 samples.
+
+    WAV chunks (SmartChunker's default output) are read in-process with
+    soundfile; other formats, or files soundfile rejects, go through FFmpeg.
+    Runs no MLX code, so it is safe on any thread; both paths release the
+    GIL while the MLX thread keeps computing.
+
+    Args:
+        audio_file: Path to audio file
+
+    Returns:
+        1-D numpy float32 array in [-1, 1]
+
+    Raises:
+        RuntimeError: If FFmpeg can't decode the file
+    """
+    import numpy as np
+
+    if Path(audio_file).suffix.lower() in _SOUNDFILE_SUFFIXES:
+        audio = _read_soundfile(audio_file)
+        if audio is not None:
+            return audio
+
+    cmd = [
+        "ffmpeg", "-nostdin", "-hide_banner", "-loglevel", "error",
+        "-threads", "1",
+        "-i", audio_file,
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(_SAMPLE_RATE),
+        "-",
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to load audio: {result.stderr.decode(errors='replace')}")
+    # One float32 buffer, scaled in place (the MLX thread copies it once more
+    # into MLX memory; mx.array can't wrap a numpy buffer without copying)
+    audio = np.frombuffer(result.stdout, np.int16).astype(np.float32)
+    audio *= 1.0 / 32768.0
+    return audio
+
+
+# chunk_<number>.<ext>, e.g. chunk_001.wav
+_CHUNK_FILE_RE = re.compile(r"^chunk_(\d+)(\.[^.]+)$")
+_CHUNK_NUM_RE = re.compile(r"chunk_(\d+)")
+
+# Overlap detection between consecutive chunks: characters compared on each
+# side, and the shortest match (whitespace removed) treated as an overlap.
+# Thai text often separates phrases with zero-width or ideographic spaces.
+_OVERLAP_WINDOW = 200
+_MIN_OVERLAP = 20
+_WS_CHARS = " \t\n\r\u3000\u200b"
+_WS_TRANS = str.maketrans("", "", _WS_CHARS)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Convert values orjson rejects but stdlib json accepts (or should)."""
+    if isinstance(obj, float):
+        return float(obj)  # e.g. numpy.float64 word timestamps from mlx_whisper
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()  # numpy/MLX scalars and arrays
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY
+            | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        return orjson.dumps(obj, default=_orjson_default, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_srt(cues: List[Tuple[float, float, str]], output_file) -> None:
+    """
+    Write (start seconds, end seconds, text) cues as an SRT file.
+
+    Every cue's timestamps are split into hours/minutes/seconds/millis with
+    numpy in one pass; only the final string formatting runs per cue.
+    """
+    import numpy as np
+
+    # Entries stream through a 1 MiB buffer instead of being joined in memory
+    with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if not cues:
+            return
+
+        millis = np.array([(start, end) for start, end, _ in cues], dtype=np.float64)
+        millis = np.maximum(np.floor(millis * 1000 + 0.5), 0).astype(np.int64)
+        hours, millis = np.divmod(millis, 3_600_000)
+        minutes, millis = np.divmod(millis, 60_000)
+        secs, millis = np.divmod(millis, 1000)
+
+        for entry_num, (cue, (h0, h1), (m0, m1), (s0, s1), (ms0, ms1)) in enumerate(
+            zip(cues, hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist()), 1
+        ):
+            f.write(
+                f"{entry_num}\n{h0:02d}:{m0:02d}:{s0:02d},{ms0:03d} --> "
+                f"{h1:02d}:{m1:02d}:{s1:02d},{ms1:03d}\n{cue[2]}\n\n"
+            )
+
+
+def _find_chunk_files(input_path: Path) -> List[Path]:
+    """Find chunk_* audio files in a directory, sorted by chunk number."""
+    entries = []
+    with os.scandir(input_path) as it:
+        for entry in it:
+            match = _CHUNK_FILE_RE.match(entry.name)
+            if match and match.group(2).lower() in CHUNK_SUFFIXES and entry.is_file():
+                entries.append((int(match.group(1)), entry.path))
+    entries.sort()
+    return [Path(path) for _, path in entries]
+
 
 class MLXTranscriber:
     """
@@ -63,6 +246,9 @@ class MLXTranscriber:
         language: str = "th",
         device: str = "auto",
         max_workers: Optional[int] = None,
+        quantization: Optional[int] = 4,
+        gc_every: int = 0,
+        batch_size: int = 4,
     ):
         """
         Initialize MLX transcriber with ThreadPool (shared model).
@@ -73,12 +259,27 @@ class MLXTranscriber:
             device: Device to use ('auto', 'cpu', 'gpu')
             max_workers: Max parallel threads (default: CPU count - 2, min 1, max 8)
                         Uses ThreadPoolExecutor with shared model for memory efficiency
+            quantization: Weight bits (4 or 8) to quantize the model to at load
+                        time, or None for full fp16. Quantized weights move far
+                        fewer bytes per matmul (faster, ~4x smaller at 4 bits)
+                        at the cost of a little accuracy. A pre-quantized
+                        "<model>-q<bits>" repo is used when one exists.
+            gc_every: Run a full gc.collect() after every N transcriptions
+                        (0 = never; refcounting frees per-chunk objects and
+                        the MLX buffer cache is cleared after each batch)
+            batch_size: 30-second windows (from different files) run through
+                        the encoder in one call; 1 encodes one window at a time
         """
         self.model_name = model
         self.language = language
         self.device = device
+        self.quantization = quantization
+        self.gc_every = gc_every
+        self.batch_size = max(1, batch_size)
+        self._transcribed = 0
         self.model = None
-        self._model_lock = threading.Lock()  # Thread-safe model access
+        self.tokenizer = None
+        self._encoder = None  # Compiled; one trace per batch size (1..batch_size)
 
         # Auto-detect optimal worker count
         if max_workers is None:
@@ -86,6 +287,15 @@ class MLXTranscriber:
             max_workers = max(1, min(cpu_count - 2, 8))  # Reserve 2 cores for system
         self.max_workers = max_workers
 
+        # All MLX calls run on one thread; decoded audio is handed to it here.
+        # The bound makes decoders wait (backpressure) once they are two
+        # batches ahead, capping how much decoded audio sits in memory.
+        self._inbox: "queue.Queue[Optional[Tuple[str, Any, Dict[str, Any], Future]]]" = queue.Queue(
+            maxsize=max_workers * 2
+        )
+        self._mlx_thread: Optional[threading.Thread] = None
+        self._decode_pool: Optional[ThreadPoolExecutor] = None
+
         logger.info(f"Initializing MLX Transcriber: {model}")
         logger.info(f"Parallel workers: {self.max_workers} (ThreadPool + Shared Model)")
         logger.info(f"Memory mode: Shared (~3-5 GB vs ~40+ GB with ProcessPool)")
@@ -96,16 +306,418 @@ class MLXTranscriber:
             return
 
         try:
-            import mlx_whisper
-            logger.info(f"Loading MLX model: {self.model_name}")
-            # MLX Whisper loads the model internally when transcribe() is called
-            self.model = mlx_whisper
-            logger.info("✓ MLX model ready")
+            import mlx.core as mx
+            from mlx_whisper.load_models import load_model
+            from mlx_whisper.tokenizer import get_tokenizer
         except ImportError:
             raise RuntimeError(
                 "mlx-whisper not installed. Install with: pip install mlx-whisper"
             )
 
+        # Load weights and tokenizer once; every chunk reuses them
+        logger.info(f"Loading MLX model: {self.model_name}")
+        self.model = self._load_weights(load_model, mx)
+        self._encoder = mx.compile(self.model.encoder)
+        self.tokenizer = get_tokenizer(
+            self.model.is_multilingual,
+            num_languages=self.model.num_languages,
+            language=self.language,
+            task="transcribe",
+        )
+        logger.info("✓ MLX model ready")
+
+        self._decode_pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="audio-decode"
+        )
+        self._mlx_thread = threading.Thread(target=self._mlx_loop, name="mlx-inference", daemon=True)
+        self._mlx_thread.start()
+
+    def _load_weights(self, load_model, mx):
+        """Load the fp16 model, quantized to self.quantization bits if set."""
+        import mlx.nn as nn
+
+        bits = self.quantization
+        if not bits:
+            return load_model(self.model_name, dtype=mx.float16)
+
+        # Prefer weights quantized offline (no local repo of that name)
+        if not Path(self.model_name).exists():
+            quantized_repo = f"{self.model_name}-q{bits}"
+            try:
+                model = load_model(quantized_repo, dtype=mx.float16)
+                logger.info(f"✓ Using pre-quantized weights: {quantized_repo}")
+                return model
+            except Exception:
+                logger.info(f"No pre-quantized {quantized_repo}, quantizing at load time")
+
+        model = load_model(self.model_name, dtype=mx.float16)
+        if any(isinstance(m, nn.QuantizedLinear) for _, m in model.named_modules()):
+            return model  # Repo already ships quantized weights
+
+        nn.quantize(
+            model,
+            group_size=64,
+            bits=bits,
+            class_predicate=lambda _, m: (
+                isinstance(m, (nn.Linear, nn.Embedding)) and m.weight.shape[-1] % 64 == 0
+            ),
+        )
+        mx.eval(model.parameters())
+        logger.info(f"✓ Quantized model weights to {bits} bits")
+        return model
+
+    def _mlx_loop(self):
+        """
+        Single consumer that owns every MLX call.
+
+        Requests are drained in batches of up to max_workers (waiting briefly
+        for stragglers) and run back to back, so the GPU never idles on a
+        lock hand-off between worker threads.
+        """
+        import mlx.core as mx
+
+        # mx.clear_cache() replaced mx.metal.clear_cache() in newer MLX
+        clear_cache = getattr(mx, "clear_cache", None) or mx.metal.clear_cache
+
+        while True:
+            item = self._inbox.get()
+            if item is None:
+                return
+            batch = [item]
+            while len(batch) < self.max_workers:
+                try:
+                    item = self._inbox.get(timeout=_BATCH_WAIT)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._inbox.put(None)  # Finish this batch, then stop (slot just freed)
+                    break
+                batch.append(item)
+
+            results: List[Any] = [None] * len(batch)
+            try:
+                mels = self._batch_mels(batch)
+                plain = [i for i, (_, _, kwargs, _) in enumerate(batch) if not kwargs]
+                for i, result in zip(plain, self._transcribe_batch(
+                    [(batch[i][1], mels[i]) for i in plain]
+                )):
+                    results[i] = result
+            except Exception as e:
+                # Fail this batch's requests below; this thread is the only
+                # consumer, so it must keep serving the ones after them
+                logger.error(f"Batch transcription failed: {e}")
+                results = [e] * len(batch)
+
+            for (audio_file, audio, kwargs, future), result in zip(batch, results):
+                try:
+                    if kwargs:
+                        # Options only the full mlx_whisper pipeline understands
+                        import mlx_whisper
+                        result = mlx_whisper.transcribe(
+                            audio,
+                            path_or_hf_repo=self.model_name,
+                            language=self.language,
+                            **kwargs
+                        )
+                    elif isinstance(result, Exception):
+                        raise result
+
+                    self._transcribed += 1
+                    if self.gc_every and self._transcribed % self.gc_every == 0:
+                        gc.collect()
+
+                    future.set_result(result)
+                except Exception as e:
+                    logger.error(f"Transcription failed for {audio_file}: {e}")
+                    future.set_exception(e)
+
+            # Return Metal buffers held by the allocator cache, without a heap walk
+            clear_cache()
+
+    def _batch_mels(self, batch: List[Tuple[str, Any, Dict[str, Any], Future]]) -> List[Any]:
+        """
+        Build log-mel spectrograms for a batch in one MLX evaluation.
+
+        MLX is lazy, so the per-item graphs are evaluated together instead
+        of one dispatch per file. Items with kwargs (handled by
+        mlx_whisper.transcribe) get None, as does the whole batch if the
+        evaluation fails, in which case each item computes its own mel and
+        reports its own error.
+        """
+        import mlx.core as mx
+        from mlx_whisper.audio import N_SAMPLES, log_mel_spectrogram
+
+        assert threading.current_thread() is self._mlx_thread, "MLX call off the MLX thread"
+
+        mels = [None] * len(batch)
+        try:
+            for i, (_, audio, kwargs, _) in enumerate(batch):
+                if not kwargs:
+                    # Pad 30 seconds of silence so the last window can be sliced whole
+                    mels[i] = log_mel_spectrogram(
+                        audio, n_mels=self.model.dims.n_mels, padding=N_SAMPLES
+                    )
+            mx.eval([mel for mel in mels if mel is not None])
+        except Exception:
+            return [None] * len(batch)
+        return mels
+
+    def _decode(self, audio_file: str, kwargs: Dict[str, Any], future: Future):
+        """Decode audio on a pool thread and hand it to the MLX thread."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            audio = _load_audio(audio_file)
+        except Exception as e:
+            logger.error(f"Transcription failed for {audio_file}: {e}")
+            future.set_exception(e)
+            return
+        self._inbox.put((audio_file, audio, kwargs, future))
+
+    def _transcribe_batch(self, items: List[Tuple[Any, Any]]) -> List[Any]:
+        """
+        Transcribe decoded audio files with the preloaded model (MLX thread only).
+
+        Same window loop as mlx_whisper.transcribe() with its default
+        options (temperature fallback, no-speech skip, timestamp segments),
+        minus word timestamps and prompting from previous windows, which
+        chunked audio doesn't use. The files advance in lockstep: each step
+        takes the current window of up to batch_size files and encodes them
+        in one [B, 3000, n_mels] encoder call; decoding (and any temperature
+        retries) then reuses each window's encoder output.
+
+        Args:
+            items: (16 kHz mono float32 samples, precomputed log-mel padded
+                   by N_SAMPLES or None) per file
+
+        Returns:
+            Per file, a dict with 'text', 'segments' and 'language', or the
+            exception that file failed with
+        """
+        from mlx_whisper.audio import (
+            HOP_LENGTH, N_FRAMES, N_SAMPLES, SAMPLE_RATE, log_mel_spectrogram, pad_or_trim,
+        )
+
+        # The model is unsynchronized: only the MLX thread may touch it
+        assert threading.current_thread() is self._mlx_thread, "MLX call off the MLX thread"
+
+        results: List[Any] = [None] * len(items)
+        states = {}  # index -> [mel, content_frames, seek, segments]
+        for i, (audio, mel) in enumerate(items):
+            try:
+                if mel is None:
+                    # Pad 30 seconds of silence so the last window can be sliced whole
+                    mel = log_mel_spectrogram(audio, n_mels=self.model.dims.n_mels, padding=N_SAMPLES)
+                states[i] = [mel, mel.shape[-2] - N_FRAMES, 0, []]
+            except Exception as e:
+                results[i] = e
+
+        while states:
+            active = [i for i, state in states.items() if state[2] < state[1]]
+            for start in range(0, len(active), self.batch_size):
+                group = active[start:start + self.batch_size]
+                sizes = {}
+                windows = []
+                for i in group:
+                    mel, content_frames, seek, _ = states[i]
+                    sizes[i] = min(N_FRAMES, content_frames - seek)
+                    windows.append(pad_or_trim(mel[seek:seek + sizes[i]], N_FRAMES, axis=-2))
+
+                for i, features in zip(group, self._encode(windows)):
+                    state = states[i]
+                    seek, segment_size = state[2], sizes[i]
+                    try:
+                        if isinstance(features, Exception):
+                            raise features
+                        result = self._decode_with_fallback(features)
+
+                        # No voice activity: skip the window
+                        if (result.no_speech_prob > _NO_SPEECH_THRESHOLD
+                                and result.avg_logprob <= _LOGPROB_THRESHOLD):
+                            state[2] = seek + segment_size
+                            continue
+
+                        window_segments, consumed = self._segments_from_result(
+                            result, seek, segment_size * HOP_LENGTH / SAMPLE_RATE
+                        )
+                    except Exception as e:
+                        results[i] = e
+                        del states[i]
+                        continue
+                    segments = state[3]
+                    for segment in window_segments:
+                        segment["id"] = len(segments)
+                        segments.append(segment)
+                    state[2] = seek + (consumed if consumed else segment_size)
+
+            for i in [i for i, state in states.items() if state[2] >= state[1]]:
+                segments = states.pop(i)[3]
+                results[i] = {
+                    "text": self.tokenizer.decode([t for seg in segments for t in seg["tokens"]]),
+                    "segments": segments,
+                    "language": self.language,
+                }
+
+        return results
+
+    def _encode(self, windows: List[Any]) -> List[Any]:
+        """
+        Run the encoder over 30 s mel windows in one batched call.
+
+        The batch is encoded at its real size, with no padding windows:
+        mx.compile keeps one trace per input shape, so at most batch_size
+        graphs are ever traced. Falls back to the uncompiled encoder one window at a time if the
+        batch fails (e.g. out of memory), so a failure is pinned on the
+        window that caused it.
+
+        Returns:
+            Per window, its [n_audio_ctx, n_audio_state] features or an exception
+        """
+        import mlx.core as mx
+
+        try:
+            batch = mx.stack(windows).astype(mx.float16)
+            features = self._encoder(batch)
+            mx.eval(features)
+            return [features[i] for i in range(len(windows))]
+        except Exception:
+            pass
+
+        encoded = []
+        for window in windows:
+            try:
+                features = self.model.encoder(window[None].astype(mx.float16))
+                mx.eval(features)
+                encoded.append(features[0])
+            except Exception as e:
+                encoded.append(e)
+        return encoded
+
+    def _decode_with_fallback(self, mel_segment):
+        """
+        Decode one 30 s window, retrying at higher temperatures on failure.
+
+        mel_segment may be the window's encoder output, which decode()
+        uses as-is instead of re-running the encoder on every retry.
+        """
+        from mlx_whisper.decoding import DecodingOptions, decode
+
+        result = None
+        for temperature in _TEMPERATURES:
+            options = DecodingOptions(language=self.language, task="transcribe", temperature=temperature)
+            result = decode(self.model, mel_segment, options)
+
+            if result.no_speech_prob > _NO_SPEECH_THRESHOLD:
+                break  # Silence, retrying won't help
+            if (result.compression_ratio <= _COMPRESSION_RATIO_THRESHOLD
+                    and result.avg_logprob >= _LOGPROB_THRESHOLD):
+                break
+        return result
+
+    def _segments_from_result(
+        self,
+        result,
+        seek: int,
+        segment_duration: float,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Split a window's tokens into timestamped segments.
+
+        Args:
+            result: DecodingResult for the window
+            seek: Mel frame the window starts at
+            segment_duration: Seconds of real audio in the window
+
+        Returns:
+            Tuple of (segments, mel frames consumed); 0 frames consumed means
+            the whole window
+        """
+        from mlx_whisper.audio import HOP_LENGTH, N_FRAMES, SAMPLE_RATE
+
+        tokenizer = self.tokenizer
+        ts_begin = tokenizer.timestamp_begin
+        input_stride = N_FRAMES // self.model.dims.n_audio_ctx  # Mel frames per token
+        time_precision = input_stride * HOP_LENGTH / SAMPLE_RATE  # 0.02 s
+        time_offset = seek * HOP_LENGTH / SAMPLE_RATE
+
+        def new_segment(start: float, end: float, tokens: List[int]) -> Dict[str, Any]:
+            text = tokenizer.decode([t for t in tokens if t < tokenizer.eot])
+            if start == end or not text.strip():
+                text, tokens = "", []
+            return {
+                "seek": seek,
+                "start": start,
+                "end": end,
+                "text": text,
+                "tokens": tokens,
+                "temperature": result.temperature,
+                "avg_logprob": result.avg_logprob,
+                "compression_ratio": result.compression_ratio,
+                "no_speech_prob": result.no_speech_prob,
+            }
+
+        tokens = list(result.tokens)
+        is_ts = [t >= ts_begin for t in tokens]
+        single_timestamp_ending = is_ts[-2:] == [False, True]
+        consecutive = [i + 1 for i in range(len(tokens) - 1) if is_ts[i] and is_ts[i + 1]]
+
+        if not consecutive:
+            duration = segment_duration
+            timestamps = [t for t in tokens if t >= ts_begin]
+            if timestamps and timestamps[-1] != ts_begin:
+                duration = (timestamps[-1] - ts_begin) * time_precision
+            return [new_segment(time_offset, time_offset + duration, tokens)], 0
+
+        slices = consecutive + ([len(tokens)] if single_timestamp_ending else [])
+        segments = []
+        last_slice = 0
+        for current_slice in slices:
+            sliced = tokens[last_slice:current_slice]
+            segments.append(new_segment(
+                time_offset + (sliced[0] - ts_begin) * time_precision,
+                time_offset + (sliced[-1] - ts_begin) * time_precision,
+                sliced,
+            ))
+            last_slice = current_slice
+
+        if single_timestamp_ending:
+            return segments, 0
+        # Unfinished last segment: the next window starts at its timestamp
+        return segments, (tokens[last_slice - 1] - ts_begin) * input_stride
+
+    def close(self):
+        """Stop the decode pool and MLX thread (pending requests are finished first)."""
+        if self._mlx_thread is not None:
+            self._decode_pool.shutdown(wait=True)  # Everything decoded is queued
+            self._decode_pool = None
+            self._inbox.put(None)
+            self._mlx_thread.join()
+            self._mlx_thread = None
+            self.model = None
+            self._encoder = None
+            self.tokenizer = None
+
+    def submit(self, audio_file: str, **kwargs) -> Future:
+        """
+        Queue an audio file for transcription.
+
+        The file is decoded on a pool thread, then transcribed on the MLX
+        thread, so decoding overlaps with inference on other files.
+
+        Args:
+            audio_file: Path to audio file
+            **kwargs: Additional arguments for mlx_whisper.transcribe() (any
+                      given send the file through mlx_whisper.transcribe()
+                      instead of the preloaded model)
+
+        Returns:
+            Future resolving to the transcription result dict
+        """
+        self._load_model()
+        future: Future = Future()
+        self._decode_pool.submit(self._decode, audio_file, kwargs, future)
+        return future
+
     def transcribe_file(
         self,
         audio_file: str,
@@ -114,6 +726,9 @@ class MLXTranscriber:
         """
         Transcribe a single audio file (thread-safe).
 
+        The file is queued for the MLX thread, which batches it with
+        requests from other threads; this call blocks until it is done.
+
         Args:
             audio_file: Path to audio file
             **kwargs: Additional arguments for mlx_whisper.transcribe()
@@ -121,25 +736,7 @@ class MLXTranscriber:
         Returns:
             Transcription result dict with 'text' and 'segments'
         """
-        self._load_model()
-
-        # Thread-safe transcription (MLX may not be fully thread-safe)
-        with self._model_lock:
-            try:
-                result = self.model.transcribe(
-                    audio_file,
-                    path_or_hf_repo=self.model_name,
-                    language=self.language,
-                    **kwargs
-                )
-
-                # Force garbage collection after each transcription
-                gc.collect()
-
-                return result
-            except Exception as e:
-                logger.error(f"Transcription failed for {audio_file}: {e}")
-                raise
+        return self.submit(audio_file, **kwargs).result()
 
     def _transcribe_chunk_thread(self, chunk_file: Path, chunk_number: int) -> Dict[str, Any]:
         """
@@ -153,7 +750,7 @@ class MLXTranscriber:
             Dict with transcription result or error
         """
         try:
-            # Use shared model with thread lock
+            # Queued for the shared MLX thread
             result = self.transcribe_file(str(chunk_file))
 
             return {
@@ -220,18 +817,17 @@ class MLXTranscriber:
         # Load chunking metadata if available
         chunks_meta = None
         if metadata_file and Path(metadata_file).exists():
-            with open(metadata_file, 'r', encoding='utf-8') as f:
-                chunking_data = json.load(f)
-                chunks_meta = chunking_data.get('chunks', [])
+            chunking_data = _json_loads(Path(metadata_file).read_bytes())
+            chunks_meta = chunking_data.get('chunks', [])
             logger.info(f"Loaded chunking metadata: {len(chunks_meta)} chunks")
 
-        # Find all audio chunks (support both MP3 and WAV)
-        chunk_files_mp3 = list(input_path.glob("chunk_*.mp3"))
-        chunk_files_wav = list(input_path.glob("chunk_*.wav"))
-        chunk_files = sorted(chunk_files_mp3 + chunk_files_wav)
+        # Find all audio chunks (WAV, MP3 or stream-copied compressed audio)
+        chunk_files = _find_chunk_files(input_path)
 
         if not chunk_files:
-            raise FileNotFoundError(f"No chunk files found in {input_dir} (looking for chunk_*.mp3 or chunk_*.wav)")
+            raise FileNotFoundError(
+                f"No chunk files found in {input_dir} (looking for chunk_* with {', '.join(CHUNK_SUFFIXES)})"
+            )
 
         total_chunks = len(chunk_files)
         logger.info(f"Found {total_chunks} chunks to process")
@@ -239,14 +835,13 @@ class MLXTranscriber:
         # Load checkpoint if exists
         processed_chunks = {}
         if checkpoint_file and Path(checkpoint_file).exists():
-            with open(checkpoint_file, 'r', encoding='utf-8') as f:
-                checkpoint_data = json.load(f)
-                processed_chunks = checkpoint_data.get('chunks', {})
+            processed_chunks = self._load_checkpoint(checkpoint_file)
             logger.info(f"Resuming from checkpoint: {len(processed_chunks)} chunks done")
 
-        # Process chunks with parallel workers
-        start_time = datetime.now()
-        results = []
+        # Process chunks with parallel workers (monotonic: immune to clock steps)
+        start_ns = time.perf_counter_ns()
+        # Indexed by chunk number - 1, so results land in order as they complete
+        results: List[Optional[Dict[str, Any]]] = [None] * total_chunks
 
         # Prepare chunks to process (skip already processed ones)
         chunks_to_process = []
@@ -256,7 +851,7 @@ class MLXTranscriber:
             # Skip if already processed (checkpoint)
             if chunk_name in processed_chunks:
                 logger.info(f"[{idx}/{total_chunks}] ✓ Skipping {chunk_name} (checkpoint)")
-                results.append((idx, processed_chunks[chunk_name]))
+                results[idx - 1] = processed_chunks[chunk_name]
                 continue
 
             chunks_to_process.append((chunk_file, idx))
@@ -267,76 +862,77 @@ class MLXTranscriber:
             logger.info(f"Memory usage: ~3-5 GB (vs ~40+ GB with separate processes)")
 
             completed_count = 0
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all tasks (use shared model instance)
-                future_to_chunk = {
-                    executor.submit(self._transcribe_chunk_thread, chunk_file, idx): (chunk_file, idx)
-                    for chunk_file, idx in chunks_to_process
-                }
-
-                # Process results as they complete
-                for future in as_completed(future_to_chunk):
-                    chunk_file, idx = future_to_chunk[future]
+            # Results are appended to the checkpoint by a writer thread, so
+            # serialization and disk speed never delay the next completion
+            checkpoint_queue: Optional["queue.Queue[Optional[Tuple[str, Dict]]]"] = None
+            if checkpoint_file:
+                checkpoint_queue = queue.Queue()
+                checkpoint_writer = threading.Thread(
+                    target=self._write_checkpoint,
+                    args=(checkpoint_file, checkpoint_queue),
+                    name="checkpoint-writer",
+                    daemon=True,
+                )
+                checkpoint_writer.start()
 
-                    try:
-                        chunk_result = future.result()
-                        completed_count += 1
-
-                        # Add chunk metadata if available
-                        if chunks_meta and idx <= len(chunks_meta):
-                            chunk_result['metadata'] = chunks_meta[idx - 1]
-
-                        results.append((idx, chunk_result))
-
-                        # Log result
-                        if chunk_result.get('success'):
-                            text_len = len(chunk_result.get('text', ''))
-                            logger.info(
-                                f"[{completed_count}/{len(chunks_to_process)}] "
-                                f"✓ chunk_{idx:03d}: {text_len} chars"
-                            )
-                        else:
-                            error = chunk_result.get('error', 'Unknown error')
-                            logger.error(
-                                f"[{completed_count}/{len(chunks_to_process)}] "
-                                f"✗ chunk_{idx:03d}: {error}"
-                            )
-
-                        # Save checkpoint every 10 completed chunks
-                        if checkpoint_file and completed_count % 10 == 0:
-                            checkpoint_data = {
-                                chunk_file.stem: result
-                                for _, result in results
-                                if result.get('success', False)
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    # Submit all tasks (use shared model instance)
+                    future_to_chunk = {
+                        executor.submit(self._transcribe_chunk_thread, chunk_file, idx): (chunk_file, idx)
+                        for chunk_file, idx in chunks_to_process
+                    }
+
+                    # Process results as they complete
+                    for future in as_completed(future_to_chunk):
+                        chunk_file, idx = future_to_chunk[future]
+
+                        try:
+                            chunk_result = future.result()
+                            completed_count += 1
+
+                            # Add chunk metadata if available
+                            if chunks_meta and idx <= len(chunks_meta):
+                                chunk_result['metadata'] = chunks_meta[idx - 1]
+
+                            results[idx - 1] = chunk_result
+
+                            # Log result
+                            if chunk_result.get('success'):
+                                text_len = len(chunk_result.get('text', ''))
+                                logger.info(
+                                    f"[{completed_count}/{len(chunks_to_process)}] "
+                                    f"✓ chunk_{idx:03d}: {text_len} chars"
+                                )
+                            else:
+                                error = chunk_result.get('error', 'Unknown error')
+                                logger.error(
+                                    f"[{completed_count}/{len(chunks_to_process)}] "
+                                    f"✗ chunk_{idx:03d}: {error}"
+                                )
+
+                            if checkpoint_queue is not None and chunk_result.get('success'):
+                                checkpoint_queue.put((chunk_file.stem, chunk_result))
+
+                        except Exception as e:
+                            logger.error(f"✗ Failed chunk_{idx:03d}: {e}")
+                            results[idx - 1] = {
+                                'chunk_number': idx,
+                                'file': str(chunk_file),
+                                'text': '',
+                                'error': str(e),
                             }
-                            with open(checkpoint_file, 'w', encoding='utf-8') as f:
-                                json.dump({'chunks': checkpoint_data}, f)
-                            logger.info(f"✓ Checkpoint saved: {completed_count}/{len(chunks_to_process)}")
-
-                    except Exception as e:
-                        logger.error(f"✗ Failed chunk_{idx:03d}: {e}")
-                        results.append((idx, {
-                            'chunk_number': idx,
-                            'file': str(chunk_file),
-                            'text': '',
-                            'error': str(e),
-                        }))
-
-        # Sort results by chunk number
-        results.sort(key=lambda x: x[0])
-        results = [r[1] for r in results]  # Extract just the result dicts
-
-        # Force garbage collection after all processing
-        gc.collect()
-        logger.info("✓ Memory cleanup completed")
+            finally:
+                if checkpoint_queue is not None:
+                    checkpoint_queue.put(None)
+                    checkpoint_writer.join()
 
         # Merge chunks with overlap detection
         logger.info("Merging chunks with overlap detection...")
         combined_text = self._merge_chunks(results, chunks_meta)
 
         # Calculate statistics
-        end_time = datetime.now()
-        processing_time = (end_time - start_time).total_seconds()
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e9
         successful_chunks = sum(1 for r in results if r.get('text', ''))
 
         final_result = {
@@ -365,8 +961,7 @@ class MLXTranscriber:
                 **final_result,
                 'chunks': results,
             }
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            json_path.write_bytes(_json_dumps(json_data, indent=True))
             final_result['output_files'].append(str(json_path))
             logger.info(f"✓ JSON saved: {json_path}")
 
@@ -382,6 +977,10 @@ class MLXTranscriber:
             Path(checkpoint_file).unlink()
             logger.info("Checkpoint file removed")
 
+        # Force garbage collection once the outputs are safely on disk
+        gc.collect()
+        logger.info("✓ Memory cleanup completed")
+
         logger.info(
             f"✅ Transcription complete: {successful_chunks}/{total_chunks} chunks "
             f"in {processing_time/60:.1f} minutes"
@@ -389,6 +988,70 @@ class MLXTranscriber:
 
         return final_result
 
+    @staticmethod
+    def _load_checkpoint(checkpoint_file: str) -> Dict[str, Dict]:
+        """
+        Read finished chunk results from a checkpoint file.
+
+        Args:
+            checkpoint_file: JSONL checkpoint ({"name", "result"} per line);
+                             the older single-object {"chunks": {...}} format
+                             is still accepted
+
+        Returns:
+            Dict of chunk name -> chunk result
+        """
+        processed_chunks = {}
+        with open(checkpoint_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json_loads(line)
+                except ValueError:  # json/orjson JSONDecodeError
+                    continue  # Line cut short by a crash mid-write
+                if 'name' in entry:
+                    processed_chunks[entry['name']] = entry['result']
+                else:
+                    processed_chunks.update(entry.get('chunks', {}))
+        return processed_chunks
+
+    @staticmethod
+    def _write_checkpoint(checkpoint_file: str, entries: "queue.Queue[Optional[Tuple[str, Dict]]]"):
+        """
+        Append queued (chunk name, result) pairs to the checkpoint until None.
+
+        Runs on its own thread; the file is flushed every 10 chunks.
+        """
+        written = 0
+        try:
+            with MLXTranscriber._open_checkpoint(checkpoint_file) as fp:
+                while True:
+                    entry = entries.get()
+                    if entry is None:
+                        return
+                    name, result = entry
+                    fp.write(_json_dumps({'name': name, 'result': result}) + b'\n')
+                    written += 1
+                    if written % 10 == 0:
+                        fp.flush()
+                        logger.info(f"✓ Checkpoint saved: {written} chunks")
+        except Exception as e:
+            logger.error(f"Checkpoint writing failed: {e}")
+
+    @staticmethod
+    def _open_checkpoint(checkpoint_file: str):
+        """Open a checkpoint file for appending, starting on a fresh line."""
+        path = Path(checkpoint_file)
+        partial_line = False
+        if path.exists() and path.stat().st_size > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, 2)
+                partial_line = f.read(1) != b'\n'
+
+        fp = open(path, 'ab', buffering=1 << 16)
+        if partial_line:
+            fp.write(b'\n')  # Old single-object checkpoint or a cut-off line
+        return fp
+
     def _merge_chunks(
         self,
         chunks: List[Dict],
@@ -439,16 +1102,18 @@ class MLXTranscriber:
 
         return '\n\n'.join(merged_parts)
 
-    def _remove_overlap(self, prev_text: str, curr_text: str, min_overlap: int = 20) -> str:
+    def _remove_overlap(self, prev_text: str, curr_text: str, min_overlap: int = _MIN_OVERLAP) -> str:
         """
         Remove overlapping text between consecutive chunks.
 
-        Looks for common text at the end of prev_text and beginning of curr_text.
+        Finds the longest start of curr_text that repeats the end of
+        prev_text (ignoring whitespace), in one linear pass of the KMP
+        prefix function over curr_head + separator + prev_tail.
 
         Args:
             prev_text: Previous chunk text
             curr_text: Current chunk text
-            min_overlap: Minimum overlap length to consider (characters)
+            min_overlap: Minimum overlap length to consider (non-space characters)
 
         Returns:
             Current text with overlap removed
@@ -456,27 +1121,36 @@ class MLXTranscriber:
         if not prev_text or not curr_text:
             return curr_text
 
-        # Check for overlap (last N chars of prev == first N chars of curr)
-        max_check = min(len(prev_text), len(curr_text), 200)  # Check up to 200 chars
-
-        best_overlap = 0
-        for overlap_len in range(max_check, min_overlap - 1, -1):
-            prev_suffix = prev_text[-overlap_len:]
-            curr_prefix = curr_text[:overlap_len]
-
-            # Normalize whitespace for comparison
-            prev_suffix_norm = ' '.join(prev_suffix.split())
-            curr_prefix_norm = ' '.join(curr_prefix.split())
-
-            if prev_suffix_norm == curr_prefix_norm:
-                best_overlap = overlap_len
-                break
+        # Check up to 200 chars on each side, whitespace removed
+        curr_head = curr_text[:_OVERLAP_WINDOW].translate(_WS_TRANS)
+        prev_tail = prev_text[-_OVERLAP_WINDOW:].translate(_WS_TRANS)
+        if len(curr_head) < min_overlap or len(prev_tail) < min_overlap:
+            return curr_text
 
-        if best_overlap > 0:
-            logger.debug(f"Found overlap: {best_overlap} chars")
-            return curr_text[best_overlap:].lstrip()
+        # prefix[i] = length of the longest proper border of text[:i + 1]
+        text = curr_head + '\0' + prev_tail
+        prefix = [0] * len(text)
+        k = 0
+        for i in range(1, len(text)):
+            while k and text[i] != text[k]:
+                k = prefix[k - 1]
+            if text[i] == text[k]:
+                k += 1
+            prefix[i] = k
+        best_overlap = prefix[-1]
+
+        if best_overlap < min_overlap:
+            return curr_text
 
-        return curr_text
+        # Map the overlap (non-space chars) back to a position in curr_text
+        seen = 0
+        for cut, char in enumerate(curr_text):
+            if char not in _WS_CHARS:
+                seen += 1
+                if seen == best_overlap:
+                    break
+        logger.debug(f"Found overlap: {best_overlap} chars")
+        return curr_text[cut + 1:].lstrip(_WS_CHARS)
 
     def _save_srt(self, chunks: List[Dict], output_file: str):
         """
@@ -486,30 +1160,22 @@ class MLXTranscriber:
             chunks: List of chunk results with segments
             output_file: Path to output SRT file
         """
-        srt_entries = []
-        entry_num = 1
-
+        cues = []
         for chunk in chunks:
             segments = chunk.get('segments', [])
             chunk_meta = chunk.get('metadata', {})
             chunk_start_offset = chunk_meta.get('start_time', 0)
 
             for seg in segments:
-                if not seg.get('text', '').strip():
+                text = seg.get('text', '').strip()
+                if not text:
                     continue
 
                 start = chunk_start_offset + seg.get('start', 0)
                 end = chunk_start_offset + seg.get('end', start + 1)
+                cues.append((start, end, text))
 
-                start_ts = self._seconds_to_srt_timestamp(start)
-                end_ts = self._seconds_to_srt_timestamp(end)
-                text = seg['text'].strip()
-
-                srt_entries.append(f"{entry_num}\n{start_ts} --> {end_ts}\n{text}\n")
-                entry_num += 1
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(srt_entries))
+        _write_srt(cues, output_file)
 
     @staticmethod
     def _seconds_to_srt_timestamp(seconds: float) -> str:
@@ -522,11 +1188,12 @@ class MLXTranscriber:
         Returns:
             SRT timestamp string
         """
-        td = timedelta(seconds=seconds)
-        hours = td.seconds // 3600
-        minutes = (td.seconds % 3600) // 60
-        secs = td.seconds % 60
-        millis = td.microseconds // 1000
+        # Integer math: no per-call timedelta, and no wrap past 24 hours.
+        # SRT has no negative times, so those clamp to zero.
+        millis = max(0, int(seconds * 1000 + 0.5))
+        hours, millis = divmod(millis, 3_600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
 
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
@@ -535,10 +1202,100 @@ class MLXTranscriber:
 # Hybrid MLX Transcriber: 2 Processes × 8 Workers
 # ============================================================================
 
+# Buffered log bytes that force a write before the next per-chunk flush
+_LOG_BUFFER_SIZE = 1 << 16
+
+
+class _BatchingFileHandler(logging.Handler):
+    """
+    Log file handler that group-commits records with one os.write.
+
+    Formatted records collect in memory until flush() (once per chunk in
+    _transcribe_chunk_batch) or until _LOG_BUFFER_SIZE bytes pile up,
+    instead of one buffered-file write per line. The file is a raw
+    O_APPEND descriptor, so there is no TextIOWrapper layer, and only the
+    listener thread calls into the handler, so the per-record handler lock
+    is skipped.
+    """
+
+    def __init__(self, filename, level=logging.NOTSET):
+        super().__init__(level)
+        self._fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+        self._buf = bytearray()
+
+    def handle(self, record):
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def emit(self, record):
+        try:
+            self._buf += self.format(record).encode('utf-8') + b'\n'
+            if len(self._buf) >= _LOG_BUFFER_SIZE:
+                self._write()
+        except Exception:
+            self.handleError(record)
+
+    def _write(self):
+        data = bytes(self._buf)
+        self._buf.clear()
+        while data:
+            data = data[os.write(self._fd, data):]
+
+    def flush(self):
+        if self._fd is not None:
+            self._write()
+
+    def close(self):
+        with self.lock:
+            if self._fd is not None:
+                self._write()
+                os.close(self._fd)
+                self._fd = None
+        super().close()
+
+
+class _ProcessFormatter(logging.Formatter):
+    """Formatter that tags every record with the worker process id."""
+
+    def __init__(self, proc_id):
+        super().__init__('%(asctime)s - [Process %(proc_id)s] - %(message)s', datefmt='%H:%M:%S')
+        self.proc_id = proc_id
+
+    def format(self, record):
+        record.proc_id = self.proc_id
+        return super().format(record)
+
+
+class _ProcessLogListener(logging.handlers.QueueListener):
+    """QueueListener that can be asked to flush its handlers, in queue order."""
+
+    _FLUSH = logging.makeLogRecord({"msg": "flush"})
+
+    def flush(self):
+        """Flush the handlers once every record queued so far is handled."""
+        self.queue.put_nowait(self._FLUSH)
+
+    def handle(self, record):
+        if record is self._FLUSH:
+            for handler in self.handlers:
+                handler.flush()
+            return
+        super().handle(record)
+
+
 def _setup_process_logger(process_id: int, log_dir: str = "/tmp") -> logging.Logger:
     """
     Setup a file logger for child process that can be tailed.
 
+    Records are only queued on the calling thread; a QueueListener thread
+    (stored as proc_logger._listener, stop it when done) formats them and
+    does the file and console writes. File writes are batched until
+    proc_logger._listener.flush(), called once per chunk. Calling this
+    again for the same process id (a reused pool worker) restarts the
+    listener on the existing handlers instead of rebuilding them.
+
     Args:
         process_id: Process identifier
         log_dir: Directory for log files
@@ -546,12 +1303,12 @@ def _setup_process_logger(process_id: int, log_dir: str = "/tmp") -> logging.Log
     Returns:
         Configured logger instance
     """
-    import logging
-    from datetime import datetime
-
     # Create unique logger for this process
     logger_name = f"mlx_process_{process_id}"
     proc_logger = logging.getLogger(logger_name)
+    if getattr(proc_logger, '_configured', False):
+        proc_logger._listener.start()
+        return proc_logger
     proc_logger.setLevel(logging.INFO)
 
     # Clear existing handlers
@@ -559,145 +1316,184 @@ def _setup_process_logger(process_id: int, log_dir: str = "/tmp") -> logging.Log
 
     # Create file handler - separate file per process for easy tailing
     log_file = Path(log_dir) / f"mlx_process_{process_id}.log"
-    file_handler = logging.FileHandler(log_file, mode='w')
+    file_handler = _BatchingFileHandler(log_file)
     file_handler.setLevel(logging.INFO)
 
-    # Create formatter with timestamp
-    formatter = logging.Formatter(
-        '%(asctime)s - [P%(process_id)s] - %(message)s',
-        datefmt='%H:%M:%S'
-    )
-
-    # Custom formatter that includes process_id
-    class ProcessFormatter(logging.Formatter):
-        def __init__(self, proc_id):
-            super().__init__('%(asctime)s - [Process %(proc_id)s] - %(message)s', datefmt='%H:%M:%S')
-            self.proc_id = proc_id
-
-        def format(self, record):
-            record.proc_id = self.proc_id
-            return super().format(record)
+    formatter = _ProcessFormatter(process_id)
+    file_handler.setFormatter(formatter)
 
-    file_handler.setFormatter(ProcessFormatter(process_id))
-    proc_logger.addHandler(file_handler)
-
-    # Also add stream handler for immediate output
+    # Also add stream handler for immediate output (unbuffered, for tail -f)
     stream_handler = logging.StreamHandler()
     stream_handler.setLevel(logging.INFO)
-    stream_handler.setFormatter(ProcessFormatter(process_id))
-    proc_logger.addHandler(stream_handler)
+    stream_handler.setFormatter(formatter)
+
+    # The hot loop only does an in-memory put; the listener thread writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    proc_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = _ProcessLogListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True
+    )
+    listener.start()
+    proc_logger._listener = listener
+    proc_logger._configured = True
 
     return proc_logger
 
 
-def _process_worker_function(
-    chunk_subset: List[Path],
+# Per-process state, set up once by _init_worker (ProcessPoolExecutor initializer)
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _init_worker(
     model_name: str,
     language: str,
     workers_per_process: int,
-    process_id: int,
-    log_dir: str = "/tmp"
-) -> Dict[str, Any]:
+    log_dir: str,
+    quantization: Optional[int],
+    process_counter,
+):
     """
-    Worker function that runs in a separate process.
-    Each process has its own MLX model instance and ThreadPool.
+    Load the model once in a worker process, for every batch it is handed.
+
+    Each process gets its own MLX model instance and decode pool. Load
+    errors are kept in _WORKER_STATE and reported per chunk, since an
+    initializer that raises breaks the whole pool.
 
     Args:
-        chunk_subset: List of chunk files for this process
         model_name: MLX model name
         language: Language code
         workers_per_process: Number of threads per process
-        process_id: Process identifier (for logging)
         log_dir: Directory for log files
-
-    Returns:
-        Dictionary with transcription results
+        quantization: Weight bits for the model, or None for fp16
+        process_counter: Shared multiprocessing.Value numbering the processes
+                         (1, 2, ...) for their log files
     """
-    import time
+    with process_counter.get_lock():
+        process_counter.value += 1
+        process_id = process_counter.value
+
     start_time = time.time()
 
     # Setup process-specific logger that writes to file
     proc_logger = _setup_process_logger(process_id, log_dir)
+    _WORKER_STATE.update(
+        process_id=process_id,
+        logger=proc_logger,
+        transcriber=None,
+        error=None,
+        start_time=start_time,
+        success_count=0,
+        fail_count=0,
+    )
+    # Pool workers end via os._exit, so atexit won't run; this will
+    multiprocessing.util.Finalize(None, _close_worker, exitpriority=10)
 
     proc_logger.info(f"=" * 60)
-    proc_logger.info(f"STARTING - {len(chunk_subset)} chunks, {workers_per_process} workers")
+    proc_logger.info(f"STARTING - {workers_per_process} workers")
     proc_logger.info(f"Model: {model_name}")
     proc_logger.info(f"=" * 60)
 
     try:
-        # Each process creates its own transcriber with ThreadPool
         proc_logger.info("Loading MLX model...")
         transcriber = MLXTranscriber(
             model=model_name,
             language=language,
-            max_workers=workers_per_process
+            max_workers=workers_per_process,
+            quantization=quantization,
         )
+        transcriber._load_model()
+        _WORKER_STATE['transcriber'] = transcriber
         proc_logger.info(f"✓ Model loaded in {time.time() - start_time:.1f}s")
+    except Exception as e:
+        _WORKER_STATE['error'] = str(e)
+        proc_logger.error(f"=" * 60)
+        proc_logger.error(f"FATAL ERROR: {e}")
+        proc_logger.error(f"=" * 60)
+    proc_logger._listener.flush()
 
-        # Transcribe assigned chunks
-        results = []
-        success_count = 0
-        fail_count = 0
 
-        for i, chunk_file in enumerate(chunk_subset, 1):
-            chunk_start = time.time()
-            try:
-                result = transcriber.transcribe_file(str(chunk_file))
-                text = result.get('text', '').strip()
-                results.append({
-                    'success': True,
-                    'file': str(chunk_file),
-                    'text': text,
-                    'segments': result.get('segments', []),
-                })
-                success_count += 1
-                elapsed = time.time() - chunk_start
-                progress = (i / len(chunk_subset)) * 100
-                proc_logger.info(f"✓ [{i}/{len(chunk_subset)}] ({progress:.1f}%) - {len(text)} chars - {elapsed:.1f}s")
-            except Exception as e:
-                fail_count += 1
-                proc_logger.error(f"✗ [{i}/{len(chunk_subset)}] FAILED: {chunk_file.name} - {e}")
-                results.append({
-                    'success': False,
-                    'file': str(chunk_file),
-                    'text': '',
-                    'error': str(e),
-                })
-
-        # Clean up
-        del transcriber
-        gc.collect()
+def _transcribe_chunk_batch(chunk_files: List[Path]) -> List[Dict[str, Any]]:
+    """
+    Transcribe a batch of chunks with this worker process's model.
 
-        total_time = time.time() - start_time
-        proc_logger.info(f"=" * 60)
-        proc_logger.info(f"COMPLETED in {total_time:.1f}s ({total_time/60:.1f} min)")
-        proc_logger.info(f"Success: {success_count}/{len(chunk_subset)} ({100*success_count/len(chunk_subset):.1f}%)")
-        if fail_count > 0:
-            proc_logger.warning(f"Failed: {fail_count} chunks")
-        proc_logger.info(f"=" * 60)
+    The whole batch is queued up front so the MLX thread can batch it.
 
-        return {
-            'process_id': process_id,
-            'success': True,
-            'results': results,
-            'stats': {
-                'total_chunks': len(chunk_subset),
-                'success_count': success_count,
-                'fail_count': fail_count,
-                'total_time': total_time,
-            }
-        }
+    Args:
+        chunk_files: Chunk files to transcribe
 
-    except Exception as e:
-        proc_logger.error(f"=" * 60)
-        proc_logger.error(f"FATAL ERROR: {e}")
-        proc_logger.error(f"=" * 60)
-        return {
-            'process_id': process_id,
-            'success': False,
-            'error': str(e),
-            'results': [],
-        }
+    Returns:
+        One result dict per chunk, in order ('success', 'file', 'text', and
+        'segments' or 'error')
+    """
+    state = _WORKER_STATE
+    proc_logger = state['logger']
+    transcriber = state['transcriber']
+    if transcriber is None:
+        state['fail_count'] += len(chunk_files)
+        return [
+            {'success': False, 'file': str(f), 'text': '', 'error': state['error']}
+            for f in chunk_files
+        ]
+
+    futures = [transcriber.submit(str(chunk_file)) for chunk_file in chunk_files]
+
+    # Collect results in order
+    results = []
+    chunk_start = time.time()
+    for i, (chunk_file, future) in enumerate(zip(chunk_files, futures), 1):
+        try:
+            result = future.result()
+            text = result.get('text', '').strip()
+            results.append({
+                'success': True,
+                'file': str(chunk_file),
+                'text': text,
+                'segments': result.get('segments', []),
+            })
+            state['success_count'] += 1
+            elapsed = time.time() - chunk_start
+            proc_logger.info(f"✓ [{i}/{len(chunk_files)}] {chunk_file.name} - {len(text)} chars - {elapsed:.1f}s")
+        except Exception as e:
+            state['fail_count'] += 1
+            proc_logger.error(f"✗ [{i}/{len(chunk_files)}] FAILED: {chunk_file.name} - {e}")
+            results.append({
+                'success': False,
+                'file': str(chunk_file),
+                'text': '',
+                'error': str(e),
+            })
+        chunk_start = time.time()
+        proc_logger._listener.flush()  # One write per chunk
+
+    return results
+
+
+def _close_worker():
+    """Release the worker's model and write its summary and queued log records."""
+    state = _WORKER_STATE
+    proc_logger = state.get('logger')
+    if proc_logger is None:
+        return
+
+    # Clean up
+    if state['transcriber'] is not None:
+        state['transcriber'].close()
+        state['transcriber'] = None
+        gc.collect()
+
+    total_time = time.time() - state['start_time']
+    total = state['success_count'] + state['fail_count']
+    proc_logger.info(f"=" * 60)
+    proc_logger.info(f"COMPLETED in {total_time:.1f}s ({total_time/60:.1f} min)")
+    if total:
+        proc_logger.info(f"Success: {state['success_count']}/{total} ({100*state['success_count']/total:.1f}%)")
+    if state['fail_count'] > 0:
+        proc_logger.warning(f"Failed: {state['fail_count']} chunks")
+    proc_logger.info(f"=" * 60)
+
+    # Write out queued records and stop the listener thread
+    proc_logger._listener.flush()
+    proc_logger._listener.stop()
 
 
 class HybridMLXTranscriber:
@@ -737,6 +1533,7 @@ class HybridMLXTranscriber:
         num_processes: int = 2,
         workers_per_process: int = 16,
         log_dir: str = "/tmp",
+        quantization: Optional[int] = 4,
     ):
         """
         Initialize Hybrid MLX Transcriber.
@@ -747,12 +1544,18 @@ class HybridMLXTranscriber:
             num_processes: Number of processes (default: 2)
             workers_per_process: Number of threads per process (default: 16)
             log_dir: Directory for process log files (default: /tmp)
+            quantization: Weight bits for each process's model (4 or 8), or
+                          None for full fp16 (see MLXTranscriber)
         """
         self.model_name = model
         self.language = language
         self.num_processes = num_processes
         self.workers_per_process = workers_per_process
         self.log_dir = log_dir
+        self.quantization = quantization
+        # Worker processes (each with its model loaded) live until close()
+        self._executor = None
+        self._executor_lock = threading.Lock()
 
         total_workers = num_processes * workers_per_process
         logger.info(f"Initializing Hybrid MLX Transcriber: {model}")
@@ -769,6 +1572,7 @@ class HybridMLXTranscriber:
         checkpoint_file: Optional[str] = None,
         generate_srt: bool = True,
         generate_json: bool = True,
+        streamed: Optional[Dict[str, Future]] = None,
     ) -> Dict[str, Any]:
         """
         Transcribe directory of audio chunks using hybrid approach.
@@ -780,29 +1584,150 @@ class HybridMLXTranscriber:
             checkpoint_file: Path to checkpoint file for resume capability
             generate_srt: Generate SRT subtitle file
             generate_json: Generate JSON metadata file
+            streamed: Chunk path -> future from submit_chunks(), for chunks
+                      already handed over while the file was being chunked
 
         Returns:
             Dictionary with transcription results and statistics
         """
-        from concurrent.futures import ProcessPoolExecutor, as_completed
         import time
 
         start_time = time.time()
         input_path = Path(input_dir)
 
         # Get all chunk files
-        chunk_files = sorted(input_path.glob("chunk_*.wav"))
+        chunk_files = _find_chunk_files(input_path)
         if not chunk_files:
             raise ValueError(f"No chunk files found in {input_dir}")
 
         logger.info(f"Found {len(chunk_files)} chunks to process")
 
-        # Split chunks between processes
-        chunk_subsets = self._split_chunks(chunk_files, self.num_processes)
+        all_results = self._transcribe_chunks(chunk_files, streamed)
+
+        return self._write_outputs(
+            all_results, len(chunk_files), output_file, generate_srt, generate_json, start_time
+        )
+
+    def transcribe_many(
+        self,
+        jobs: List[Tuple[str, str, Optional[str]]],
+        generate_srt: bool = True,
+        generate_json: bool = True,
+        streamed: Optional[Dict[str, Future]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Transcribe several chunk directories in one pass.
+
+        All chunks are spread over a single set of worker processes, so the
+        model is loaded once for the whole group instead of once per
+        directory; results are then split back per directory.
+
+        Args:
+            jobs: List of (input_dir, output_file, metadata_file) tuples
+            generate_srt: Generate SRT subtitle file
+            generate_json: Generate JSON metadata file
+            streamed: Chunk path -> future from submit_chunks(), for chunks
+                      already handed over while their file was being chunked
+
+        Returns:
+            One result dictionary per job, in the same order as jobs
+        """
+        import time
+
+        start_time = time.time()
+
+        chunk_files_per_job = []
+        for input_dir, _, _ in jobs:
+            chunk_files = _find_chunk_files(Path(input_dir))
+            if not chunk_files:
+                raise ValueError(f"No chunk files found in {input_dir}")
+            chunk_files_per_job.append(chunk_files)
 
-        logger.info(f"Split into {len(chunk_subsets)} process groups:")
-        for i, subset in enumerate(chunk_subsets, 1):
-            logger.info(f"  Process {i}: {len(subset)} chunks")
+        all_chunk_files = [f for files in chunk_files_per_job for f in files]
+        logger.info(f"Found {len(all_chunk_files)} chunks to process across {len(jobs)} directories")
+
+        # Split results back by the directory each chunk came from
+        results_by_dir: Dict[str, List[Dict]] = {
+            str(Path(input_dir)): [] for input_dir, _, _ in jobs
+        }
+        for result in self._transcribe_chunks(all_chunk_files, streamed):
+            results_by_dir[str(Path(result['file']).parent)].append(result)
+
+        return [
+            self._write_outputs(
+                results_by_dir[str(Path(input_dir))], len(chunk_files), output_file,
+                generate_srt, generate_json, start_time,
+            )
+            for (input_dir, output_file, _), chunk_files in zip(jobs, chunk_files_per_job)
+        ]
+
+    def submit_chunks(self, chunk_files: List[Path]) -> Future:
+        """
+        Start transcribing chunks before the rest of their file is ready.
+
+        Lets a producer feed chunks to the worker processes while it is
+        still chunking the file. Pass the returned futures (per chunk path)
+        as `streamed` to transcribe_directory() / transcribe_many(), which
+        then only transcribe the chunks that were not handed over.
+
+        Args:
+            chunk_files: Finished chunk files
+
+        Returns:
+            Future resolving to one result dict per chunk
+        """
+        return self._get_executor().submit(_transcribe_chunk_batch, list(chunk_files))
+
+    def _get_executor(self):
+        """Get the worker processes, starting them on first use."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        with self._executor_lock:
+            if self._executor is None:
+                # Each worker loads its model once, in the initializer, and
+                # keeps it for every batch of every later call
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.num_processes,
+                    initializer=_init_worker,
+                    initargs=(
+                        self.model_name,
+                        self.language,
+                        self.workers_per_process,
+                        self.log_dir,
+                        self.quantization,
+                        multiprocessing.Value('i', 0),
+                    ),
+                )
+            return self._executor
+
+    def _transcribe_chunks(
+        self,
+        chunk_files: List[Path],
+        streamed: Optional[Dict[str, Future]] = None,
+    ) -> List[Dict]:
+        """Transcribe chunk files across the worker processes (unordered results)."""
+        # Chunks already submitted by submit_chunks() are only collected
+        pending: Dict[Future, List[Path]] = {}
+        if streamed:
+            remaining = []
+            for chunk_file in chunk_files:
+                future = streamed.get(str(chunk_file))
+                if future is None:
+                    remaining.append(chunk_file)
+                else:
+                    pending.setdefault(future, []).append(chunk_file)
+            if pending:
+                logger.info(f"{len(chunk_files) - len(remaining)} chunks already streamed to the workers")
+            chunk_files = remaining
+
+        # Small batches handed out on demand: a process that finishes early
+        # takes the next batch instead of idling while another catches up.
+        # Largest files (a proxy for duration) go first, so the long jobs
+        # start early and the short ones fill in the tail.
+        by_size = sorted(chunk_files, key=lambda p: p.stat().st_size, reverse=True)
+        chunksize = max(1, len(by_size) // (self.num_processes * 4))
+        batches = [by_size[i:i + chunksize] for i in range(0, len(by_size), chunksize)]
+        logger.info(f"Split into {len(batches)} batches of up to {chunksize} chunks")
 
         # Process chunks in parallel processes
         all_results = []
@@ -810,39 +1735,55 @@ class HybridMLXTranscriber:
         logger.info(f"Starting {self.num_processes} parallel processes...")
         logger.info(f"📋 Monitor progress: tail -f {self.log_dir}/mlx_process_*.log")
 
-        with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
-            # Submit process tasks
-            futures = {}
-            for process_id, chunk_subset in enumerate(chunk_subsets, 1):
-                future = executor.submit(
-                    _process_worker_function,
-                    chunk_subset,
-                    self.model_name,
-                    self.language,
-                    self.workers_per_process,
-                    process_id,
-                    self.log_dir
+        # One future per batch, collected on its own: a batch whose process
+        # dies only fails its own chunks
+        failed = []
+        for batch in batches:
+            try:
+                pending[self._get_executor().submit(_transcribe_chunk_batch, batch)] = batch
+            except Exception as e:
+                failed.append((batch, e))
+
+        for future, batch in pending.items():
+            try:
+                all_results.extend(future.result())
+            except Exception as e:
+                failed.append((batch, e))
+
+        if failed:
+            for batch, e in failed:
+                logger.error(f"✗ Worker process exception ({len(batch)} chunks): {e}")
+                all_results.extend(
+                    {'success': False, 'file': str(f), 'text': '', 'error': str(e)}
+                    for f in batch
                 )
-                futures[future] = process_id
+            self.close()  # Start fresh worker processes next time
 
-            # Collect results as they complete
-            for future in as_completed(futures):
-                process_id = futures[future]
-                try:
-                    process_result = future.result()
-                    if process_result['success']:
-                        all_results.extend(process_result['results'])
-                        logger.info(f"✓ Process {process_id} completed successfully")
-                    else:
-                        logger.error(f"✗ Process {process_id} failed: {process_result.get('error')}")
-                except Exception as e:
-                    logger.error(f"✗ Process {process_id} exception: {e}")
+        return all_results
+
+    def close(self):
+        """Shut down the worker processes and release their models."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    def _write_outputs(
+        self,
+        all_results: List[Dict],
+        total_chunks: int,
+        output_file: str,
+        generate_srt: bool,
+        generate_json: bool,
+        start_time: float,
+    ) -> Dict[str, Any]:
+        """Merge chunk results for one file and write its output files."""
+        import time
 
         # Sort results by chunk number
         all_results.sort(key=lambda x: self._extract_chunk_number(x['file']))
 
         # Calculate statistics
-        total_chunks = len(chunk_files)
         successful_chunks = sum(1 for r in all_results if r['success'])
         success_rate = (successful_chunks / total_chunks * 100) if total_chunks > 0 else 0
 
@@ -873,8 +1814,7 @@ class HybridMLXTranscriber:
                     'architecture': f"{self.num_processes}×{self.workers_per_process}",
                 }
             }
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, ensure_ascii=False, indent=2)
+            Path(json_file).write_bytes(_json_dumps(json_data, indent=True))
             output_files.append(json_file)
             logger.info(f"✓ JSON saved: {json_file}")
 
@@ -910,18 +1850,14 @@ class HybridMLXTranscriber:
             'output_files': output_files,
         }
 
-    @staticmethod
-    def _split_chunks(chunk_files: List[Path], num_groups: int) -> List[List[Path]]:
-        """Split chunks evenly between process groups."""
-        subsets = [[] for _ in range(num_groups)]
-        for i, chunk_file in enumerate(chunk_files):
-            subsets[i % num_groups].append(chunk_file)
-        return subsets
-
     @staticmethod
     def _extract_chunk_number(filename: str) -> int:
         """Extract chunk number from filename."""
-        match = re.search(r'chunk_(\d+)', filename)
+        # Fast path for SmartChunker names (chunk_001.wav); regex for the rest
+        stem = Path(filename).stem
+        if stem.startswith('chunk_') and stem[6:].isdecimal():
+            return int(stem[6:])
+        match = _CHUNK_NUM_RE.search(filename)
         return int(match.group(1)) if match else 0
 
     @staticmethod
@@ -936,39 +1872,26 @@ class HybridMLXTranscriber:
     @staticmethod
     def _save_srt(chunks: List[Dict], output_file: str):
         """Save transcription as SRT subtitle file."""
-        srt_entries = []
-        entry_num = 1
-
+        cues = []
         for chunk in chunks:
-            segments = chunk.get('segments', [])
-            if not segments:
-                continue
-
-            for seg in segments:
-                if not seg.get('text', '').strip():
+            for seg in chunk.get('segments', []):
+                text = seg.get('text', '').strip()
+                if not text:
                     continue
 
                 start = seg.get('start', 0)
                 end = seg.get('end', start + 1)
+                cues.append((start, end, text))
 
-                start_ts = HybridMLXTranscriber._seconds_to_srt_timestamp(start)
-                end_ts = HybridMLXTranscriber._seconds_to_srt_timestamp(end)
-                text = seg['text'].strip()
-
-                srt_entries.append(f"{entry_num}\n{start_ts} --> {end_ts}\n{text}\n")
-                entry_num += 1
-
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(srt_entries))
+        _write_srt(cues, output_file)
 
     @staticmethod
     def _seconds_to_srt_timestamp(seconds: float) -> str:
         """Convert seconds to SRT timestamp format."""
-        td = timedelta(seconds=seconds)
-        hours = td.seconds // 3600
-        minutes = (td.seconds % 3600) // 60
-        secs = td.seconds % 60
-        millis = td.microseconds // 1000
+        millis = max(0, int(seconds * 1000 + 0.5))
+        hours, millis = divmod(millis, 3_600_000)
+        minutes, millis = divmod(millis, 60_000)
+        secs, millis = divmod(millis, 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
 
 
@@ -56,6 +56,7 @@ from .system import (
 
 from .audio import (
     get_audio_duration,
+    get_audio_durations,
     run_transcription,
 )
 
@@ -76,6 +77,7 @@ __all__ = [
     'calculate_optimal_workers',
     # Audio
     'get_audio_duration',
+    'get_audio_durations',
     'run_transcription',
     # Models
     'get_available_models',
@@ -6,6 +6,7 @@ Functions for audio file processing and transcription.
 Impact Analysis:
 ===============
 - get_audio_duration(): Used by transcribe page for duration display
+- get_audio_durations(): Batch form for many files (e.g. a chunks directory)
 - run_transcription(): Core transcription function, affects all transcription
 
 Dependencies:
@@ -25,14 +26,21 @@ External Dependencies:
 Functions:
 =========
 - get_audio_duration(file_path: str) -> float
+- get_audio_durations(file_paths: list[str]) -> list[float]
 - run_transcription(...) -> dict
 """
 
+import functools
+import json
+import os
+import re
+import select
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Callable, Optional
+from typing import Dict, Callable, List, Optional
 
 from .config import (
     PROJECT_ROOT,
@@ -40,6 +48,37 @@ from .config import (
     DEFAULT_OVERLAP_DURATION,
 )
 
+# Line breaks as text-mode pipes see them (\r alone is a tqdm-style redraw)
+_LINE_BREAK = re.compile(rb"\r\n|\r|\n")
+
+
+def _pop_lines(buf: bytearray, final: bool = False) -> List[bytes]:
+    """
+    Remove complete lines from the front of buf and return them.
+
+    Args:
+        buf: Bytes read so far; an incomplete last line stays in it
+        final: The stream has ended, so the rest of buf is the last line
+
+    Returns:
+        list[bytes]: Lines without their line breaks
+    """
+    if final:
+        cut = len(buf)
+    else:
+        cut = max(buf.rfind(b"\n"), buf.rfind(b"\r")) + 1
+        if cut and buf[cut - 1] == ord("\r"):
+            # Could be the first half of a \r\n split across reads
+            cut = max(buf.rfind(b"\n", 0, cut - 1), buf.rfind(b"\r", 0, cut - 1)) + 1
+    if not cut:
+        return []
+
+    lines = _LINE_BREAK.split(bytes(buf[:cut]))
+    del buf[:cut]
+    if lines[-1] == b"":
+        lines.pop()
+    return lines
+
 
 def get_audio_duration(file_path: str) -> float:
     """
@@ -64,18 +103,55 @@ def get_audio_duration(file_path: str) -> float:
         >>> print(f"{duration:.1f} minutes")
         74.4 minutes
     """
-    try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-show_entries', 
-             'format=duration', '-of', 'default=noprint_wrappers=1:nokey=1', 
-             file_path],
-            capture_output=True, 
-            text=True
-        )
-        duration_seconds = float(result.stdout.strip())
-        return duration_seconds / 60  # Convert to minutes
-    except Exception:
-        return 0.0
+    return get_audio_durations([file_path])[0]
+
+
+def get_audio_durations(file_paths: List[str]) -> List[float]:
+    """
+    Get durations in minutes for many audio files.
+
+    ffprobe reads one input per run, so files that aren't cached yet are
+    probed concurrently instead of one after another.
+
+    Args:
+        file_paths: Paths to audio files
+
+    Returns:
+        list[float]: Duration in minutes per file (0.0 where detection fails)
+
+    Example:
+        >>> get_audio_durations(["chunk_001.wav", "chunk_002.wav"])
+        [0.5, 0.5]
+    """
+    def probe(file_path: str) -> float:
+        try:
+            st = os.stat(file_path)
+            # Keyed on size and mtime so a replaced file is probed again
+            duration_seconds = _probe_duration(file_path, st.st_mtime_ns, st.st_size)
+            return duration_seconds / 60  # Convert to minutes
+        except Exception:
+            return 0.0
+
+    if len(file_paths) <= 1:
+        return [probe(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(len(file_paths), os.cpu_count() or 4)) as pool:
+        return list(pool.map(probe, file_paths))
+
+
+@functools.lru_cache(maxsize=512)
+def _probe_duration(file_path: str, mtime_ns: int, size: int) -> float:
+    """
+    Run ffprobe for a file's duration in seconds (cached per file version).
+
+    Raises on failure, so failed probes are retried rather than cached.
+    """
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+         '-print_format', 'json', file_path],
+        capture_output=True,
+        text=True
+    )
+    return float(json.loads(result.stdout)['format']['duration'])
 
 
 def run_transcription(
@@ -147,16 +223,35 @@ def run_transcription(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
     
+    # Drain the pipe in large non-blocking reads so the pipeline never
+    # stalls on a full pipe while a callback runs, then split lines here
+    fd = process.stdout.fileno()
+    os.set_blocking(fd, False)
+    buf = bytearray()
     logs = []
-    for line in process.stdout:
-        line = line.strip()
-        logs.append(line)
-        if progress_callback:
-            progress_callback(line)
+    eof = False
+    while not eof:
+        ready, _, _ = select.select([fd], [], [], 0.1)
+        if not ready:
+            continue
+        while True:
+            try:
+                data = os.read(fd, 1 << 16)
+            except BlockingIOError:
+                break
+            if not data:
+                eof = True
+                break
+            buf += data
+        for raw_line in _pop_lines(buf, final=eof):
+            line = raw_line.decode('utf-8', errors='replace').strip()
+            logs.append(line)
+            if progress_callback:
+                progress_callback(line)
+    process.stdout.close()
     
     process.wait()
     elapsed = time.time() - start_time
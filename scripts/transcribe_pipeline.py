@@ -119,8 +119,8 @@ Monitor Progress:
     parser.add_argument(
         '--preprocess-workers',
         type=int,
-        default=2,
-        help='Number of parallel preprocessing workers (default: 2)'
+        default=None,
+        help='Number of parallel preprocessing workers (default: auto from CPU count)'
     )
     parser.add_argument(
         '--transcribe-processes',
@@ -214,7 +214,7 @@ Monitor Progress:
     logger.info(f"Model: {model_path}")
     logger.info(f"Language: {args.language}")
     logger.info(f"Pipeline Config:")
-    logger.info(f"  - Preprocessing: {args.preprocess_workers} parallel workers (CPU)")
+    logger.info(f"  - Preprocessing: {args.preprocess_workers or 'auto'} parallel workers (CPU)")
     logger.info(f"  - Transcription: {args.transcribe_processes} proc × {args.transcribe_workers} workers (GPU)")
     logger.info(f"  - Chunking: {args.chunk_duration}s + {args.overlap}s overlap")
     logger.info("=" * 70)
@@ -271,6 +271,9 @@ Monitor Progress:
         traceback.print_exc()
         return 1
 
+    finally:
+        pipeline.close()
+
 
 if __name__ == "__main__":
     sys.exit(main())